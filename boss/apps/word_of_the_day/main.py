@@ -3,12 +3,19 @@
 Uses Wordnik API. Refresh infrequently (half-day) or manually.
 """
 from __future__ import annotations
+import functools
 import time
 
-try:
-    import requests  # type: ignore
-except Exception:  # pragma: no cover
-    requests = None  # type: ignore
+
+@functools.lru_cache(maxsize=1)
+def _get_requests():
+    """Import ``requests`` on first use; cache the module (or None if missing)."""
+    try:
+        import requests  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    return requests
+
 
 def _summarize_error(err: Exception) -> str:
     resp = getattr(err, 'response', None)
@@ -27,65 +34,78 @@ def _summarize_error(err: Exception) -> str:
     return msg
 
 API_URL = "https://api.wordnik.com/v4/words.json/wordOfTheDay"
+TITLE = "Word of the Day"
 
 
 def fetch_word(api_key: str | None, timeout: float = 6.0):
-    if requests is None:
+    rq = _get_requests()
+    if rq is None:
         raise RuntimeError("requests not available")
     params = {}
     if api_key:
         params["api_key"] = api_key
-    r = requests.get(API_URL, params=params, timeout=timeout)
+    r = rq.get(API_URL, params=params, timeout=timeout)
     r.raise_for_status()
     data = r.json()
     word = data.get("word") or "?"
-    defs = data.get("definitions", [{}])[0].get("text", "No definition.")
-    example = data.get("examples", [{}])[0].get("text", "")
+    defs = (data.get("definitions") or ({},))[0].get("text", "No definition.")
+    example = (data.get("examples") or ({},))[0].get("text", "")
     return word, defs, example
 
 
+@functools.lru_cache(maxsize=4)
+def _format(word: str, defs: str, example: str) -> str:
+    lines = [TITLE, "", word, defs]  # no truncation; backend will wrap
+    if example:
+        lines.append("")
+        lines.append("Ex: " + example)
+    return "\n".join(lines)
+
+
 def run(stop_event, api):
     cfg = api.get_app_config() or {}
     # STRICT canonical secret only (2025-09-01): per-app config api_key or canonical secret
     from boss.config.secrets_manager import secrets
     api_key = cfg.get("api_key") or secrets.get("BOSS_APP_WORDNIK_API_KEY")
+    # Wall-clock duration, measured with the monotonic clock (immune to NTP jumps)
     refresh_seconds = float(cfg.get("refresh_seconds", 43200))
     timeout = float(cfg.get("request_timeout_seconds", 6))
 
     api.screen.clear_screen()
-    title = "Word of the Day"
-    api.screen.display_text(title, font_size=28, align="center")
+    api.screen.display_text(TITLE, font_size=28, align="center")
     api.hardware.set_led("green", True)
 
     sub_ids = []
     last_fetch = 0.0
+    last_rendered = None
 
     def show():
+        nonlocal last_rendered
         try:
             word, defs, example = fetch_word(api_key, timeout=timeout)
-            defs_txt = defs  # no truncation; backend will wrap
-            lines = [title, "", word, defs_txt]
-            if example:
-                lines.append("")
-                lines.append("Ex: " + example)
-            api.screen.display_text("\n".join(lines), align="left")
+            text = _format(word, defs, example)
         except Exception as e:
-            api.screen.display_text(f"{title}\n\nErr: {e}", align="left")
+            text = f"{TITLE}\n\nErr: {e}"
+        # Skip redundant redraws when a manual refresh returns the same word
+        if text != last_rendered:
+            api.screen.display_text(text, align="left")
+            last_rendered = text
 
     def on_button(event_type, payload):
         nonlocal last_fetch
-        if payload.get("button") == "green":
-            last_fetch = time.time()
-            show()
+        last_fetch = time.monotonic()
+        show()
 
-    sub_ids.append(api.event_bus.subscribe("button_pressed", on_button))
+    # Let the bus filter for green so other button presses never reach this app
+    sub_ids.append(api.event_bus.subscribe("button_pressed", on_button, filter_dict={"button": "green"}))
 
     try:
         show()
-        last_fetch = time.time()
+        last_fetch = time.monotonic()
         while not stop_event.is_set():
-            if time.time() - last_fetch >= refresh_seconds:
-                last_fetch = time.time()
+            now = time.monotonic()
+            if now - last_fetch >= refresh_seconds:
+                last_fetch = now
                 show()
             time.sleep(0.5)
     finally:
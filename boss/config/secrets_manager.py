@@ -26,6 +26,8 @@ _SYSTEM_SECRET_FILE = Path("/etc/boss/secrets.env")  # production Pi standard
 
 
 class _SecretsManager:
+    __slots__ = ("_secret_file", "_loaded", "_file_cache", "_lock")
+
     def __init__(self, secret_file: Path = _DEFAULT_SECRET_FILE):
         self._secret_file = secret_file
         self._loaded = False
@@ -76,24 +78,26 @@ class _SecretsManager:
         if _SYSTEM_SECRET_FILE not in candidates:
             candidates.append(_SYSTEM_SECRET_FILE)
 
+        env = os.environ
         for path in candidates:
-            if not path.exists():
-                continue
             try:
-                for line in path.read_text(encoding="utf-8").splitlines():
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-                    if "=" not in line:
-                        logger.warning("Ignoring malformed secret line (no '='): %s", line)
-                        continue
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key and key not in os.environ:  # do not override real env
-                        self._file_cache[key] = value
+                with path.open("r", encoding="utf-8") as fh:
+                    for line in fh:
+                        line = line.strip()
+                        if not line or line.startswith("#"):
+                            continue
+                        if "=" not in line:
+                            logger.warning("Ignoring malformed secret line (no '='): %s", line)
+                            continue
+                        key, value = line.split("=", 1)
+                        key = key.strip()
+                        value = value.strip()
+                        if key and key not in env:  # do not override real env
+                            self._file_cache[key] = value
                 logger.debug("Loaded secrets from %s (keys=%d)", path, len(self._file_cache))
                 return  # stop after first existing file
+            except FileNotFoundError:
+                continue
             except Exception:  # pragma: no cover - defensive
                 logger.exception("Failed loading secrets file: %s", path)
         # None found; silent (acceptable) — rely purely on process env
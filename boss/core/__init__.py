@@ -1,8 +1,13 @@
 """Core facade for flattened BOSS architecture.
 
 Provides a simplified, explicit import surface for core components.
+Components are imported lazily on first attribute access so that importing
+a single submodule (e.g. ``boss.core.event_bus``) does not pull in the
+heavier managers.
 """
 
+import importlib
+
 __all__ = [
     "AppManager",
     "AppRunner",
@@ -12,9 +17,24 @@ __all__ = [
     "AppAPI",
 ]
 
-from .app_manager import AppManager
-from .app_runner import AppRunner
-from .hardware_manager import HardwareManager
-from .system_manager import SystemManager
-from .event_bus import EventBus
-from .api import AppAPI
+_LAZY_EXPORTS = {
+    "AppManager": ".app_manager",
+    "AppRunner": ".app_runner",
+    "HardwareManager": ".hardware_manager",
+    "SystemManager": ".system_manager",
+    "EventBus": ".event_bus",
+    "AppAPI": ".api",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
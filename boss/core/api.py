@@ -10,9 +10,12 @@ try:
 except Exception:  # pragma: no cover - fallback if import path changes early
     estimate_char_columns = None  # type: ignore
 from boss.core.interfaces.app_api import AppAPIInterface, EventBusInterface, ScreenAPIInterface, HardwareAPIInterface
+from boss.core.interfaces.hardware import ScreenSize
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_SCREEN_SIZE = ScreenSize(800, 480)
+
 
 class AppEventBus(EventBusInterface):
     """Event bus interface for mini-apps."""
@@ -22,14 +25,14 @@ class AppEventBus(EventBusInterface):
         self._app_name = app_name
         self._subscriptions = []  # Track subscriptions for cleanup
     
-    def subscribe(self, event_type: str, handler: Callable, filter_dict: Optional[Dict[str, Any]] = None) -> str:
+    def subscribe(self, event_type: str, handler: Callable, filter_dict: Optional[Dict[str, Any]] = None) -> int:
         """Subscribe to events."""
         subscription_id = self._event_bus.subscribe(event_type, handler, filter_dict)
         self._subscriptions.append(subscription_id)
         logger.debug(f"App {self._app_name} subscribed to {event_type}")
         return subscription_id
     
-    def unsubscribe(self, subscription_id: str) -> None:
+    def unsubscribe(self, subscription_id: int) -> None:
         """Unsubscribe from events."""
         self._event_bus.unsubscribe(subscription_id)
         if subscription_id in self._subscriptions:
@@ -125,9 +128,9 @@ class AppScreenAPI(ScreenAPIInterface):
         """Clear screen with specified color."""
         self._event_bus.publish("screen_update", {"content_type": "clear", "content": color}, f"app:{self._app_name}")
     
-    def get_screen_size(self) -> tuple:
+    def get_screen_size(self) -> ScreenSize:
         """Get screen dimensions (width, height)."""
-        return (800, 480)
+        return _DEFAULT_SCREEN_SIZE
 
     def estimate_columns(self, font_size: int = 18) -> int:
         """Best-effort estimate of character columns for given font size.
@@ -185,6 +188,16 @@ class AppHardwareAPI(HardwareAPIInterface):
 
 class AppAPI(AppAPIInterface):
     """Complete API implementation provided to mini-apps."""
+
+    __slots__ = (
+        "_app_name",
+        "_app_path",
+        "_app_manager",
+        "_config_cache",
+        "_event_bus",
+        "_screen",
+        "_hardware",
+    )
     
     def __init__(self, event_bus, app_name: str, app_path: Path, app_manager=None):
         self._app_name = app_name
@@ -278,15 +291,14 @@ class AppAPI(AppAPIInterface):
                 return []
             # Fallback to building from full app list
             apps = self._app_manager.get_all_apps()
-            summary = []
-            for switch, app in apps.items():
-                summary.append({
-                    "number": str(switch).zfill(3),
+            return [
+                {
+                    "number": f"{switch:03d}",
                     "name": app.manifest.name,
                     "description": getattr(app.manifest, 'description', '') or ''
-                })
-            summary.sort(key=lambda x: int(x["number"]))
-            return summary
+                }
+                for switch, app in sorted(apps.items())
+            ]
         except Exception as e:
             logger.error(f"Error getting app summaries for {self._app_name}: {e}")
             return []
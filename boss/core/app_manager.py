@@ -5,9 +5,15 @@ App Manager Service - Manages loading and tracking of mini-apps.
 import logging
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, List
+from types import MappingProxyType
+from typing import Dict, Optional, List, Mapping, Tuple
 from boss.core.models import App, AppManifest, AppStatus
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
 try:
     # Import secrets manager via flat facade
     from boss.config.secrets_manager import secrets  # type: ignore
@@ -17,9 +23,31 @@ from boss.core.interfaces.services import AppManagerService
 
 logger = logging.getLogger(__name__)
 
+# Parse raw file bytes directly; orjson when available, stdlib json otherwise
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Below this many apps, thread start-up costs more than overlapping the reads saves
+_PARALLEL_LOAD_MIN = 8
+_LOADER_WORKERS = 8
+
 
 class AppManager(AppManagerService):
     """Service for managing mini-apps."""
+
+    __slots__ = (
+        "apps_directory",
+        "event_bus",
+        "hardware_service",
+        "config",
+        "_system_default_backend",
+        "_apps",
+        "_apps_by_switch",
+        "_app_summaries_cache",
+        "_app_mappings_file",
+        "_mappings_stamp",
+        "_mappings_cache",
+        "_current_app",
+    )
     
     def __init__(self, apps_directory: Path, event_bus, hardware_service, config, system_default_backend: Optional[str] = None):
         self.apps_directory = apps_directory
@@ -42,17 +70,29 @@ class AppManager(AppManagerService):
         
         # Internal state
         self._apps = {}
+        # Flat switch-indexed table (switch values are 0-255) for input-path lookups
+        self._apps_by_switch: List[Optional[App]] = [None] * 256
         # Cached lightweight summaries for fast access (number, name, description)
         self._app_summaries_cache = None
         self._app_mappings_file = apps_directory.parent / "config" / "app_mappings.json"
+        # (path, st_mtime_ns) of the last parsed mappings file, and its parsed result
+        self._mappings_stamp: Optional[Tuple[Path, int]] = None
+        self._mappings_cache: Dict[str, str] = {}
         self._current_app = None
     
     def load_apps(self) -> None:
         """Load all available apps from the apps directory and mappings file."""
         logger.info(f"Loading apps from {self.apps_directory}")
         
-        # Load app mappings
+        # Load app mappings and invert once (app name -> switch value)
         mappings = self._load_app_mappings()
+        name_to_switch: Dict[str, int] = {}
+        for switch_str, mapped_app_name in mappings.items():
+            try:
+                # First mapping wins if an app is listed under several switches
+                name_to_switch.setdefault(mapped_app_name, int(switch_str))
+            except ValueError:
+                logger.warning(f"Invalid switch value in mappings: {switch_str}")
         
         # Scan for app directories
         if not self.apps_directory.exists():
@@ -60,36 +100,54 @@ class AppManager(AppManagerService):
             return
         
         loaded_count = 0
-        for app_dir in self.apps_directory.iterdir():
-            if not app_dir.is_dir() or app_dir.name.startswith('.') or app_dir.name.startswith('_'):
-                continue
-            
+        # os.scandir caches the d_type per entry, saving a stat() per directory
+        with os.scandir(self.apps_directory) as entries:
+            app_dirs = [
+                Path(entry.path) for entry in entries
+                if entry.name[0] not in ('.', '_') and entry.is_dir(follow_symlinks=False)
+            ]
+
+        def try_load(app_dir: Path):
             try:
-                app = self._load_app(app_dir, mappings)
+                return self._load_app(app_dir, name_to_switch), None
+            except Exception as e:
+                return None, e
+
+        # Manifest reads are I/O bound: overlap them, then register apps serially
+        if len(app_dirs) >= _PARALLEL_LOAD_MIN:
+            with ThreadPoolExecutor(max_workers=_LOADER_WORKERS, thread_name_prefix="AppLoader") as pool:
+                results = list(pool.map(try_load, app_dirs))
+        else:
+            results = [try_load(app_dir) for app_dir in app_dirs]
+
+        # Snapshot env and secrets once; membership checks replace per-app lookups
+        env_keys = frozenset(os.environ)
+        secret_keys: frozenset = frozenset()
+        if secrets is not None:
+            try:
+                # Loads the secrets file once; keep non-empty values only (as secrets.get callers expect)
+                secret_keys = frozenset(k for k, v in secrets.as_dict().items() if v)
+            except Exception:
+                # Conservative: treat secrets as missing if secrets manager errors
+                secret_keys = frozenset()
+        for app_dir, (app, load_error) in zip(app_dirs, results):
+            try:
+                if load_error is not None:
+                    raise load_error
                 if app:
                     # Validate required_env presence
                     missing = []
-                    for env_name in getattr(app.manifest, 'required_env', []) or []:
+                    for env_name in app.manifest.required_env:  # __post_init__ guarantees a list
                         if not env_name:
                             continue
-                        present = False
-                        if env_name in os.environ:
-                            present = True
-                        elif secrets is not None:
-                            try:
-                                if secrets.get(env_name):  # triggers lazy file load once
-                                    present = True
-                            except Exception:
-                                # Conservative: treat as missing if secrets manager errors
-                                present = False
-                        if not present:
+                        if env_name not in env_keys and env_name not in secret_keys:
                             missing.append(env_name)
                     if missing:
                         app.mark_error(f"Missing required env vars: {', '.join(missing)}")
                         logger.warning(
                             "App '%s' disabled (missing env): %s", app.manifest.name, ", ".join(missing)
                         )
-                    self._apps[app.switch_value] = app
+                    self._register_app(app)
                     loaded_count += 1
                     logger.debug(f"Loaded app: {app.manifest.name} -> switch {app.switch_value}")
             
@@ -100,23 +158,22 @@ class AppManager(AppManagerService):
 
         # Build cached summaries (sorted by switch number)
         try:
-            summaries: List[Dict] = []
-            for switch, app in self._apps.items():
-                summaries.append({
-                    "number": str(switch).zfill(3),
-                    "name": app.manifest.name,
-                    "description": getattr(app.manifest, 'description', '') or ''
-                })
-            summaries.sort(key=lambda x: int(x["number"]))
-            self._app_summaries_cache = summaries
+            self._app_summaries_cache = self._build_app_summaries()
             logger.debug("App summaries cache built")
         except Exception as e:
             logger.debug(f"Failed building app summaries cache: {e}")
             self._app_summaries_cache = None
     
+    def _register_app(self, app: App) -> None:
+        """Record a loaded app in the switch dict and the lookup table."""
+        self._apps[app.switch_value] = app
+        self._apps_by_switch[app.switch_value] = app
+    
     def get_app_by_switch_value(self, switch_value: int) -> Optional[App]:
         """Get the app mapped to a switch value."""
-        return self._apps.get(switch_value)
+        if 0 <= switch_value < 256:
+            return self._apps_by_switch[switch_value]
+        return None
     
     def get_all_apps(self) -> Dict[int, App]:
         """Get all loaded apps."""
@@ -131,47 +188,55 @@ class AppManager(AppManagerService):
         self._current_app = app
     
     def _load_app_mappings(self) -> Dict[str, str]:
-        """Load switch-to-app mappings from JSON file."""
+        """Load switch-to-app mappings from JSON file.
+
+        The parsed result is reused while the file's mtime is unchanged.
+        """
         try:
-            if self._app_mappings_file.exists():
-                with open(self._app_mappings_file, 'r') as f:
-                    data = json.load(f)
-                    # Handle nested structure with "app_mappings" key
-                    if isinstance(data, dict) and "app_mappings" in data:
-                        return data["app_mappings"]
-                    else:
-                        return data
-            else:
-                logger.warning(f"App mappings file not found: {self._app_mappings_file}")
+            mappings_file = self._app_mappings_file
+            try:
+                stamp = (mappings_file, os.stat(mappings_file).st_mtime_ns)
+            except FileNotFoundError:
+                logger.warning(f"App mappings file not found: {mappings_file}")
                 return {}
+            if stamp == self._mappings_stamp:
+                return self._mappings_cache
+            data = _loads(mappings_file.read_bytes())
+            # Handle nested structure with "app_mappings" key
+            if isinstance(data, dict) and "app_mappings" in data:
+                data = data["app_mappings"]
+            self._mappings_cache = data
+            self._mappings_stamp = stamp
+            return data
         except Exception as e:
             logger.error(f"Error loading app mappings: {e}")
             return {}
     
-    def _load_app(self, app_dir: Path, mappings: Dict[str, str]) -> Optional[App]:
-        """Load a single app from its directory."""
+    def _load_app(self, app_dir: Path, name_to_switch: Dict[str, int]) -> Optional[App]:
+        """Load a single app from its directory.
+
+        Args:
+            app_dir: Directory containing the app's manifest and entry point
+            name_to_switch: Inverted app mappings (app name -> switch value)
+        """
         app_name = app_dir.name
         
-        # Find switch value by looking for this app name in the mappings values
-        switch_value = None
-        for switch_str, mapped_app_name in mappings.items():
-            if mapped_app_name == app_name:
-                try:
-                    switch_value = int(switch_str)
-                    break
-                except ValueError:
-                    logger.warning(f"Invalid switch value in mappings: {switch_str}")
-                    continue
-        
+        switch_value = name_to_switch.get(app_name)
         if switch_value is None:
             logger.warning(f"No switch mapping found for app: {app_name}")
             return None
         
+        # One directory listing answers both the manifest and entry point checks
+        try:
+            dir_entries = frozenset(os.listdir(app_dir))
+        except OSError:
+            dir_entries = frozenset()
+        
         # Load manifest
-        manifest_file = app_dir / "manifest.json"
-        if not manifest_file.exists():
+        if "manifest.json" not in dir_entries:
             logger.warning(f"No manifest.json found for app: {app_name}")
             return None
+        manifest_file = app_dir / "manifest.json"
         
         try:
             manifest = AppManifest.from_file(manifest_file)
@@ -184,7 +249,8 @@ class AppManager(AppManagerService):
             app = App(
                 switch_value=switch_value,
                 manifest=manifest,
-                app_path=app_dir
+                app_path=app_dir,
+                dir_entries=dir_entries
             )
             return app
         except Exception as e:
@@ -195,28 +261,37 @@ class AppManager(AppManagerService):
         """Get a list of all apps for external interfaces."""
         return [app.to_dict() for app in self._apps.values()]
 
-    def get_app_summaries(self) -> List[Dict]:
-        """Return cached list of app summaries: number, name, description."""
-        if self._app_summaries_cache is not None:
-            # Return a shallow copy to prevent external mutation
-            return list(self._app_summaries_cache)
-
-        # Fallback: compute on demand if cache missing
-        summaries: List[Dict] = []
-        for switch, app in self._apps.items():
-            summaries.append({
-                "number": str(switch).zfill(3),
+    def _build_app_summaries(self) -> Tuple[Mapping[str, str], ...]:
+        """Build the immutable summaries tuple, sorted by switch number."""
+        return tuple(
+            MappingProxyType({
+                "number": f"{switch:03d}",
                 "name": app.manifest.name,
-                "description": getattr(app.manifest, 'description', '') or ''
+                "description": app.manifest.description or ''
             })
-        summaries.sort(key=lambda x: int(x["number"]))
-        self._app_summaries_cache = summaries
-        return list(self._app_summaries_cache)
+            for switch, app in sorted(self._apps.items())
+        )
+
+    def get_app_summaries(self) -> List[Dict]:
+        """Return app summaries (number, name, description) as a new list of dicts."""
+        return [dict(summary) for summary in self.get_app_summaries_view()]
+
+    def get_app_summaries_view(self) -> Tuple[Mapping[str, str], ...]:
+        """Return the cached app summaries without copying.
+
+        The tuple and its read-only mappings are shared between callers; use
+        get_app_summaries() for data that may be modified.
+        """
+        if self._app_summaries_cache is None:
+            # Fallback: compute on demand if cache missing
+            self._app_summaries_cache = self._build_app_summaries()
+        return self._app_summaries_cache
     
     def reload_apps(self) -> None:
         """Reload all apps from disk."""
         logger.info("Reloading apps")
         self._apps.clear()
+        self._apps_by_switch = [None] * 256
         self._app_summaries_cache = None
         self.load_apps()
 
@@ -8,12 +8,15 @@ import time
 import sys
 import importlib.util
 from pathlib import Path
-from typing import Optional, Any
+from typing import Dict, Optional, Any, Tuple
 from boss.core.models import App, AppStatus
 from boss.core.interfaces.services import AppRunnerService
 
 logger = logging.getLogger(__name__)
 
+# Apps tagged with any of these rerun after a timeout unless the manifest says otherwise
+_RERUN_TAGS = frozenset(("weather", "network"))
+
 
 class AppRunner(AppRunnerService):
     """Service for running mini-apps in threads."""
@@ -25,6 +28,9 @@ class AppRunner(AppRunnerService):
         self._current_thread: Optional[threading.Thread] = None
         self._stop_event: Optional[threading.Event] = None
         self._lock = threading.RLock()
+        # Loaded app modules keyed by entry point, with the file's mtime so
+        # edits are picked up on the next launch
+        self._module_cache: Dict[Path, Tuple[int, Any]] = {}
     
     def start_app(self, app: App) -> None:
         """Start running an app in a new thread."""
@@ -36,8 +42,8 @@ class AppRunner(AppRunnerService):
             # If we're relaunching the same App object (or it hasn't fully
             # transitioned to STOPPED yet), wait briefly for it to settle.
             if not app.can_start:
-                deadline = time.time() + 1.0  # up to ~1s grace
-                while not app.can_start and time.time() < deadline:
+                deadline = time.monotonic() + 1.0  # up to ~1s grace
+                while not app.can_start and time.monotonic() < deadline:
                     time.sleep(0.05)
 
             # As a last resort (threads can't be force-killed), reset state to
@@ -141,7 +147,7 @@ class AppRunner(AppRunnerService):
                 raise Exception("App module missing 'run' function")
 
             # Run the app with timeout
-            start_time = time.time()
+            start_time = time.monotonic()
             timeout = app.manifest.timeout_seconds
 
             logger.info(f"Running app: {app.manifest.name}")
@@ -164,7 +170,7 @@ class AppRunner(AppRunnerService):
             app_module.run(stop_event, app_api)
 
             # App finished normally
-            runtime = time.time() - start_time
+            runtime = time.monotonic() - start_time
             logger.info(f"App {app.manifest.name} finished normally after {runtime:.1f} seconds")
         except Exception as e:
             error_msg = f"App error: {e}"
@@ -201,11 +207,11 @@ class AppRunner(AppRunnerService):
                     self._stop_event = None
             # Post-timeout behavior: if app timed out, decide next action based on manifest or tag-based defaults
             try:
-                behavior = getattr(app.manifest, 'timeout_behavior', None)
+                behavior = app.manifest.timeout_behavior
                 # Tag-based defaults: network/weather apps typically want to rerun
                 if behavior is None:
-                    tags = getattr(app.manifest, 'tags', []) or []
-                    if any(t in ('weather', 'network') for t in tags):
+                    tags = app.manifest.tags or []
+                    if not _RERUN_TAGS.isdisjoint(tags):
                         behavior = 'rerun'
                     else:
                         behavior = 'return'
@@ -213,7 +219,7 @@ class AppRunner(AppRunnerService):
                     logger.info(f"App {app.manifest.name} timeout behavior: {behavior}")
                     if behavior == 'rerun':
                         # Relaunch the same app after a short cooldown
-                        cooldown = getattr(app.manifest, 'timeout_cooldown_seconds', 1)
+                        cooldown = app.manifest.timeout_cooldown_seconds
                         time.sleep(float(cooldown))
                         try:
                             # Ensure no other app is running
@@ -230,14 +236,20 @@ class AppRunner(AppRunnerService):
                 logger.exception("Error handling post-timeout behavior")
     
     def _load_app_module(self, app: App) -> Optional[Any]:
-        """Dynamically load app module."""
+        """Dynamically load app module (cached until the entry point changes)."""
         try:
             entry_point_path = app.app_path / app.manifest.entry_point
             
-            if not entry_point_path.exists():
+            try:
+                mtime_ns = entry_point_path.stat().st_mtime_ns
+            except OSError:
                 logger.error(f"Entry point not found: {entry_point_path}")
                 return None
             
+            cached = self._module_cache.get(entry_point_path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            
             # Create module spec
             spec = importlib.util.spec_from_file_location(
                 f"app_{app.manifest.name}",
@@ -262,6 +274,7 @@ class AppRunner(AppRunnerService):
             else:
                 spec.loader.exec_module(module)
             
+            self._module_cache[entry_point_path] = (mtime_ns, module)
             return module
             
         except Exception as e:
@@ -2,26 +2,188 @@
 Simple, robust event bus for B.O.S.S.
 """
 
+import itertools
 import logging
+import sys
 import threading
-import queue
 import time
-import uuid
-from typing import Dict, List, Callable, Any, Optional
-from dataclasses import dataclass
+from collections import deque
+from typing import Dict, Callable, Any, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
 from boss.core.events.domain_events import DomainEvent
 
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for filter keys absent from a payload
+_MISSING = object()
+# Upper bound on events drained from the queue per worker wake-up
+_MAX_BATCH = 64
+# Filtered subscriptions on one event type before the bloom prefilter is used
+_BLOOM_MIN_FILTERED = 4
+
+# Subscription IDs: process-wide monotonic counter (next() is atomic under the GIL)
+_SUBSCRIPTION_COUNTER = itertools.count(1)
+
+# Bound once: publish paths call this per event
+_now = time.time
+
 
 @dataclass
 class Subscription:
     """Event subscription."""
-    id: str
+    id: int
     event_type: str
     handler: Callable
     filter_dict: Optional[Dict[str, Any]] = None
+    # Payload predicate compiled from filter_dict (None = match everything)
+    matcher: Optional[Callable[[Dict[str, Any]], bool]] = field(default=None, repr=False, compare=False)
+    # 64-bit bloom over the filter's (key, value) items (0 = no filter)
+    filter_bloom: int = field(default=0, repr=False, compare=False)
+
+
+# Compiled dispatch entry: (handler, matcher or None, filter bloom, subscription)
+_DispatchEntry = Tuple[Callable, Optional[Callable[[Dict[str, Any]], bool]], int, Subscription]
+
+
+class _UnfilteredDispatch(tuple):
+    """Dispatch tuple for an event type where no subscriber has a filter."""
+    __slots__ = ()
+
+
+def _filter_bloom(filter_dict: Optional[Dict[str, Any]]) -> int:
+    """Bloom bits for a filter's (key, value) pairs; unhashable values are skipped."""
+    bits = 0
+    for item in (filter_dict or {}).items():
+        try:
+            bits |= 1 << (hash(item) & 63)
+        except TypeError:
+            pass  # cannot prefilter on this pair; the matcher still checks it
+    return bits
+
+
+def _payload_bloom(payload: Dict[str, Any]) -> int:
+    """Bloom bits for a payload's items, or -1 (all bits) if any value is unhashable."""
+    bits = 0
+    try:
+        for item in payload.items():
+            bits |= 1 << (hash(item) & 63)
+    except TypeError:
+        return -1
+    return bits
+
+
+def _compile_filter(filter_dict: Optional[Dict[str, Any]]) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """Compile a subscription filter into a payload predicate.
+
+    A payload matches when every filter key is present with an equal value.
+    Identity is checked before equality since filter values are usually the
+    same interned strings/small ints the publisher used.
+    """
+    if not filter_dict:
+        return None  # empty filter matches everything
+    items = tuple(
+        (key, sys.intern(value) if type(value) is str else value)
+        for key, value in filter_dict.items()
+    )
+    if len(items) == 1:
+        ((key, value),) = items
+
+        def match_one(payload: Dict[str, Any]) -> bool:
+            found = payload.get(key, _MISSING)
+            return found is value or found == value
+
+        return match_one
+
+    def match_all(payload: Dict[str, Any]) -> bool:
+        for key, value in items:
+            found = payload.get(key, _MISSING)
+            if found is not value and found != value:
+                return False
+        return True
+
+    return match_all
+
+
+class _ConflatedSlot:
+    """Queue placeholder whose item is replaced while it is still pending."""
+    __slots__ = ("key", "item")
+
+    def __init__(self, key: Any, item: Any):
+        self.key = key
+        self.item = item
+
+
+class _EventQueue:
+    """Bounded FIFO for the bus worker: a deque guarded by one Condition.
+
+    Cheaper than ``queue.Queue`` for this use: one lock round-trip per put and
+    a single wait per drained batch rather than per event.
+    """
+    __slots__ = ("maxsize", "_items", "_cv", "_pending")
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: deque = deque()
+        self._cv = threading.Condition(threading.Lock())
+        # Conflation key -> slot still waiting in _items
+        self._pending: Dict[Any, _ConflatedSlot] = {}
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def put(self, item: Any, force: bool = False) -> bool:
+        """Append ``item``; returns False if the queue is full (unless ``force``)."""
+        with self._cv:
+            if not force and 0 < self.maxsize <= len(self._items):
+                return False
+            self._items.append(item)
+            self._cv.notify()
+        return True
+
+    def put_many(self, items: List[Any]) -> int:
+        """Append as many of ``items`` as fit with a single wake-up; returns the count."""
+        with self._cv:
+            room = len(items) if self.maxsize <= 0 else max(0, self.maxsize - len(self._items))
+            accepted = items[:room]
+            if accepted:
+                self._items.extend(accepted)
+                self._cv.notify()
+        return len(accepted)
+
+    def put_conflating(self, key: Any, item: Any) -> bool:
+        """Queue ``item``, replacing a still-pending item with the same ``key``.
+
+        A replaced item keeps its original queue position. Returns False if a
+        new slot was needed and the queue is full.
+        """
+        with self._cv:
+            slot = self._pending.get(key)
+            if slot is not None:
+                slot.item = item
+                return True
+            if 0 < self.maxsize <= len(self._items):
+                return False
+            slot = self._pending[key] = _ConflatedSlot(key, item)
+            self._items.append(slot)
+            self._cv.notify()
+        return True
+
+    def drain(self, limit: int, timeout: float) -> list:
+        """Wait up to ``timeout`` for items, then pop at most ``limit`` of them."""
+        with self._cv:
+            items = self._items
+            if not items:
+                self._cv.wait(timeout)
+            popleft = items.popleft
+            batch = [popleft() for _ in range(min(limit, len(items)))]
+            if self._pending:
+                # Resolve slots under the lock so later puts start a fresh slot
+                for i, item in enumerate(batch):
+                    if type(item) is _ConflatedSlot:
+                        del self._pending[item.key]
+                        batch[i] = item.item
+            return batch
 
 
 class EventBus:
@@ -29,18 +191,50 @@ class EventBus:
     Simple, robust event bus for BOSS.
     
     Features:
-    - Thread-safe event publishing and subscription
+    - Thread-safe event publishing and subscription (locks sharded per event type)
     - Event filtering
+    - Event types (and string filter values) are interned, so lookups and
+      filter checks usually succeed on an identity compare
     - Automatic cleanup of failed handlers
     - Simple logging for debugging
     """
     
     def __init__(self, queue_size: int = 1000):
-        self._subscriptions: Dict[str, List[Subscription]] = {}
-        self._event_queue = queue.Queue(maxsize=queue_size)
+        # Copy-on-write: each value is replaced wholesale, never mutated in place
+        self._subscriptions: Dict[str, Tuple[Subscription, ...]] = {}
+        # Immutable per-type dispatch tuples, rebuilt whenever subscriptions change
+        self._dispatch: Dict[str, Tuple[_DispatchEntry, ...]] = {}
+        # Event types whose dispatch uses the bloom prefilter
+        self._bloom_types: set = set()
+        # Subscription ID -> Subscription, so unsubscribe need not scan every type
+        self._by_id: Dict[int, Subscription] = {}
+        self._event_queue = _EventQueue(queue_size)
         self._worker_thread: Optional[threading.Thread] = None
         self._running = False
+        # Guards start/stop only; subscription tables are sharded per event type
         self._lock = threading.RLock()
+        # Guards key insertion/removal in the shared dicts; taken inside a type shard, never around one
+        self._table_lock = threading.Lock()
+        self._type_locks: Dict[str, threading.RLock] = {}
+        
+    def _lock_for(self, event_type: str) -> threading.RLock:
+        """Return the lock shard for ``event_type``, creating it on first use.
+
+        The subscription list for the type is created alongside the lock.
+        Every write that adds or removes a key in a shared table
+        (``_type_locks``, ``_subscriptions``, ``_dispatch``, ``_by_id``,
+        ``_bloom_types``) happens under ``_table_lock``; the type shard only
+        serializes updates for one event type.
+        """
+        lock = self._type_locks.get(event_type)
+        if lock is None:
+            with self._table_lock:
+                lock = self._type_locks.get(event_type)
+                if lock is None:
+                    lock = threading.RLock()
+                    self._subscriptions.setdefault(event_type, ())
+                    self._type_locks[event_type] = lock
+        return lock
         
     def start(self) -> None:
         """Start the event bus processing thread."""
@@ -62,10 +256,7 @@ class EventBus:
             self._running = False
             
             # Signal worker thread to stop
-            try:
-                self._event_queue.put(None, timeout=1.0)
-            except queue.Full:
-                pass
+            self._event_queue.put(None, force=True)
             
             # Wait for worker thread to finish
             if self._worker_thread and self._worker_thread.is_alive():
@@ -82,27 +273,98 @@ class EventBus:
             payload: Event data
             source: Source of the event
         """
+        event_type = sys.intern(event_type)
         # Allow publishing before start: queue the event and process once started.
         # This avoids losing early boot events (e.g., hardware init) while keeping
         # start/stop lifecycle explicit.
+        # Once running, events nobody listens to are dropped here rather than
+        # being allocated, queued and discarded by the worker thread.
+        if self._running and not self._dispatch.get(event_type):
+            return
         
         event = DomainEvent(
             event_type=event_type,
-            timestamp=time.time(),
+            timestamp=_now(),
             payload=payload,
             source=source
         )
         
-        try:
-            self._event_queue.put(event, timeout=1.0)
+        if not self._event_queue.put(event):
+            logger.error(f"Event queue full, dropping event: {event_type}")
+        elif logger.isEnabledFor(logging.DEBUG):
             if self._running:
-                logger.debug(f"Published event: {event_type} from {source}")
+                logger.debug("Published event: %s from %s", event_type, source)
             else:
-                logger.debug(f"Queued (pre-start) event: {event_type} from {source}")
-        except queue.Full:
+                logger.debug("Queued (pre-start) event: %s from %s", event_type, source)
+    
+    def publish_conflating(self, event_type: str, conflation_key: Any, payload: Dict[str, Any], source: str = "system") -> None:
+        """
+        Publish a state event where only the latest value matters.
+        
+        If an event with the same type and ``conflation_key`` is still queued,
+        its payload is replaced in place instead of queueing another event, so
+        a slow consumer sees the newest state without a backlog.
+        
+        Args:
+            event_type: Type of event
+            conflation_key: Identifies the piece of state (e.g. an LED color)
+            payload: Event data
+            source: Source of the event
+        """
+        event_type = sys.intern(event_type)
+        if self._running and not self._dispatch.get(event_type):
+            return
+        
+        event = DomainEvent(
+            event_type=event_type,
+            timestamp=_now(),
+            payload=payload,
+            source=source
+        )
+        
+        if not self._event_queue.put_conflating((event_type, conflation_key), event):
             logger.error(f"Event queue full, dropping event: {event_type}")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published conflating event: %s from %s", event_type, source)
+    
+    def has_subscribers(self, event_type: str) -> bool:
+        """Return whether publishing ``event_type`` now would reach a handler.
+
+        Always True before start(), since pre-start events are queued for
+        handlers that may subscribe later. Lets hot publishers skip building
+        payloads nobody will receive.
+        """
+        return not self._running or bool(self._dispatch.get(event_type))
     
-    def subscribe(self, event_type: str, handler: Callable, filter_dict: Optional[Dict[str, Any]] = None) -> str:
+    def publish_many(self, events: Iterable[Tuple[str, Dict[str, Any], str]]) -> None:
+        """
+        Publish several events at once.
+        
+        All events share one timestamp and are enqueued under a single lock
+        acquisition, waking the worker once. Order is preserved.
+        
+        Args:
+            events: (event_type, payload, source) tuples
+        """
+        timestamp = _now()
+        running = self._running
+        dispatch = self._dispatch
+        batch = []
+        for event_type, payload, source in events:
+            event_type = sys.intern(event_type)
+            if running and not dispatch.get(event_type):
+                continue
+            batch.append(DomainEvent(event_type=event_type, timestamp=timestamp, payload=payload, source=source))
+        if not batch:
+            return
+        
+        accepted = self._event_queue.put_many(batch)
+        for event in batch[accepted:]:
+            logger.error(f"Event queue full, dropping event: {event.event_type}")
+        if accepted and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published %d events", accepted)
+    
+    def subscribe(self, event_type: str, handler: Callable, filter_dict: Optional[Dict[str, Any]] = None) -> int:
         """
         Subscribe to events.
         
@@ -114,36 +376,52 @@ class EventBus:
         Returns:
             Subscription ID for unsubscribing
         """
-        subscription_id = str(uuid.uuid4())
+        event_type = sys.intern(event_type)
+        subscription_id = next(_SUBSCRIPTION_COUNTER)
         subscription = Subscription(
             id=subscription_id,
             event_type=event_type,
             handler=handler,
-            filter_dict=filter_dict
+            filter_dict=filter_dict,
+            matcher=_compile_filter(filter_dict),
+            filter_bloom=_filter_bloom(filter_dict)
         )
         
-        with self._lock:
-            if event_type not in self._subscriptions:
-                self._subscriptions[event_type] = []
-            self._subscriptions[event_type].append(subscription)
+        with self._lock_for(event_type):
+            self._subscriptions[event_type] = self._subscriptions[event_type] + (subscription,)
+            with self._table_lock:
+                self._by_id[subscription_id] = subscription
+            self._rebuild_dispatch(event_type)
         
-        logger.debug(f"Subscribed to {event_type} with ID {subscription_id}")
+        logger.debug("Subscribed to %s with ID %s", event_type, subscription_id)
         return subscription_id
     
-    def unsubscribe(self, subscription_id: str) -> None:
+    def unsubscribe(self, subscription_id: int) -> None:
         """
         Unsubscribe from events.
         
+        Dispatch runs without holding the lock, so a handler may still receive
+        an event that was already being dispatched when it unsubscribed.
+        
         Args:
             subscription_id: ID returned from subscribe()
         """
-        with self._lock:
-            for event_type, subscriptions in self._subscriptions.items():
-                self._subscriptions[event_type] = [
-                    sub for sub in subscriptions if sub.id != subscription_id
-                ]
+        subscription = self._by_id.get(subscription_id)
+        if subscription is None:
+            return
         
-        logger.debug(f"Unsubscribed {subscription_id}")
+        event_type = subscription.event_type
+        with self._lock_for(event_type):
+            with self._table_lock:
+                removed = self._by_id.pop(subscription_id, None)
+            if removed is None:
+                return  # removed concurrently
+            self._subscriptions[event_type] = tuple(
+                sub for sub in self._subscriptions[event_type] if sub is not subscription
+            )
+            self._rebuild_dispatch(event_type)
+        
+        logger.debug("Unsubscribed %s", subscription_id)
     
     def _process_events(self) -> None:
         """Process events in worker thread."""
@@ -151,72 +429,119 @@ class EventBus:
         
         while self._running:
             try:
-                # Get event from queue with timeout
-                event = self._event_queue.get(timeout=1.0)
+                # Wait for events, then take everything pending (up to a cap)
+                batch = self._event_queue.drain(_MAX_BATCH, timeout=1.0)
                 
-                # None signals shutdown
-                if event is None:
+                shutdown = False
+                for event in batch:
+                    # None signals shutdown
+                    if event is None:
+                        shutdown = True
+                        break
+                    self._handle_event(event)
+                if shutdown:
                     break
                 
-                self._handle_event(event)
-                
-            except queue.Empty:
-                continue
             except Exception as e:
                 logger.error(f"Error in event processing loop: {e}")
         
         logger.info("Event bus worker thread stopped")
     
+    def _rebuild_dispatch(self, event_type: str) -> None:
+        """Recompile the dispatch tuple for an event type (caller holds the type's lock shard)."""
+        subscriptions = self._subscriptions.get(event_type, ())
+        entries = tuple(
+            (sub.handler, sub.matcher, sub.filter_bloom, sub)
+            for sub in subscriptions
+        )
+        if not any(sub.matcher is not None for sub in subscriptions):
+            # Tagging the tuple itself keeps the flag consistent with the entries
+            entries = _UnfilteredDispatch(entries)
+        use_bloom = sum(1 for sub in subscriptions if sub.filter_bloom) >= _BLOOM_MIN_FILTERED
+        with self._table_lock:
+            self._dispatch[event_type] = entries
+            if use_bloom:
+                self._bloom_types.add(event_type)
+            else:
+                self._bloom_types.discard(event_type)
+    
     def _handle_event(self, event: DomainEvent) -> None:
-        """Handle a single event by calling all matching subscribers."""
-        with self._lock:
-            subscriptions = self._subscriptions.get(event.event_type, [])
+        """Handle a single event by calling all matching subscribers.
+
+        Iterates an immutable dispatch snapshot with no lock held, so handlers
+        may freely publish, subscribe or unsubscribe.
+        """
+        event_type = event.event_type
+        dispatch = self._dispatch.get(event_type)
         
-        if not subscriptions:
-            logger.debug(f"No subscribers for event: {event.event_type}")
+        if not dispatch:
+            logger.debug("No subscribers for event: %s", event_type)
             return
         
         # Call each subscriber
+        payload = event.payload
+        debug = logger.isEnabledFor(logging.DEBUG)
         failed_subscriptions = []
-        for subscription in subscriptions:
+        if type(dispatch) is _UnfilteredDispatch:
+            # No filters on this type: call every handler without matching
+            for handler, _, _, subscription in dispatch:
+                try:
+                    handler(event_type, payload)
+                    if debug:
+                        logger.debug("Handled event %s with subscription %s", event_type, subscription.id)
+                except Exception as e:
+                    logger.error(f"Error in event handler {subscription.id} for {event_type}: {e}")
+                    failed_subscriptions.append(subscription)
+            if failed_subscriptions:
+                self._remove_failed(event_type, failed_subscriptions)
+            return
+        
+        # With many filtered subscribers, reject most mismatches with one AND
+        # against the payload's bloom bits before running the exact matcher
+        event_bloom = _payload_bloom(payload) if event_type in self._bloom_types else -1
+        for handler, matcher, bloom, subscription in dispatch:
+            if bloom & event_bloom != bloom:
+                continue
             try:
                 # Check if event matches filter
-                if self._matches_filter(event, subscription.filter_dict):
-                    subscription.handler(event.event_type, event.payload)
-                    logger.debug(f"Handled event {event.event_type} with subscription {subscription.id}")
+                if matcher is None or matcher(payload):
+                    handler(event_type, payload)
+                    if debug:
+                        logger.debug("Handled event %s with subscription %s", event_type, subscription.id)
                 
             except Exception as e:
-                logger.error(f"Error in event handler {subscription.id} for {event.event_type}: {e}")
+                logger.error(f"Error in event handler {subscription.id} for {event_type}: {e}")
                 failed_subscriptions.append(subscription)
         
-        # Remove failed subscriptions
         if failed_subscriptions:
-            with self._lock:
-                for failed_sub in failed_subscriptions:
-                    try:
-                        self._subscriptions[event.event_type].remove(failed_sub)
-                        logger.warning(f"Removed failed subscription {failed_sub.id}")
-                    except ValueError:
-                        pass  # Already removed
+            self._remove_failed(event_type, failed_subscriptions)
     
-    def _matches_filter(self, event: DomainEvent, filter_dict: Optional[Dict[str, Any]]) -> bool:
-        """Check if event matches subscription filter."""
-        if filter_dict is None:
-            return True
-        
-        for key, value in filter_dict.items():
-            if key not in event.payload or event.payload[key] != value:
-                return False
-        
-        return True
+    def _remove_failed(self, event_type: str, failed_subscriptions: List[Subscription]) -> None:
+        """Drop subscriptions whose handlers raised."""
+        with self._lock_for(event_type):
+            failed_ids = {sub.id for sub in failed_subscriptions}
+            current = self._subscriptions[event_type]
+            remaining = tuple(sub for sub in current if sub.id not in failed_ids)
+            for failed_sub in current:
+                if failed_sub.id in failed_ids:
+                    with self._table_lock:
+                        self._by_id.pop(failed_sub.id, None)
+                    logger.warning(f"Removed failed subscription {failed_sub.id}")
+            self._subscriptions[event_type] = remaining
+            self._rebuild_dispatch(event_type)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get event bus statistics."""
-        with self._lock:
-            subscription_count = sum(len(subs) for subs in self._subscriptions.values())
-            return {
-                "running": self._running,
-                "queue_size": self._event_queue.qsize(),
-                "subscription_count": subscription_count,
-                "event_types": list(self._subscriptions.keys())
-            }
+        with self._table_lock:
+            event_types = list(self._type_locks.items())
+        
+        subscription_count = 0
+        for event_type, lock in event_types:
+            with lock:
+                subscription_count += len(self._subscriptions[event_type])
+        return {
+            "running": self._running,
+            "queue_size": self._event_queue.qsize(),
+            "subscription_count": subscription_count,
+            "event_types": [event_type for event_type, _ in event_types]
+        }
@@ -7,23 +7,24 @@ from typing import Any, Dict, Optional
 import time
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DomainEvent:
-    """Base class for all domain events."""
+    """Base class for all domain events.
+
+    Immutable and slotted: events are shared across threads by the bus, and
+    one is allocated per publish. Callers always supply ``timestamp``.
+    """
     event_type: str
     timestamp: float
     payload: Dict[str, Any]
     source: str
-    
-    def __post_init__(self):
-        if not self.timestamp:
-            self.timestamp = time.time()
 
 
 # Hardware Events
-@dataclass
 class SwitchChangedEvent(DomainEvent):
     """Fired when switch values change."""
+    __slots__ = ()
+
     def __init__(self, old_value: int, new_value: int, source: str = "hardware"):
         super().__init__(
             event_type="switch_changed",
@@ -33,9 +34,10 @@ class SwitchChangedEvent(DomainEvent):
         )
 
 
-@dataclass
 class ButtonPressedEvent(DomainEvent):
     """Fired when a button is pressed."""
+    __slots__ = ()
+
     def __init__(self, button_color: str, source: str = "hardware"):
         super().__init__(
             event_type="button_pressed",
@@ -45,9 +47,10 @@ class ButtonPressedEvent(DomainEvent):
         )
 
 
-@dataclass
 class ButtonReleasedEvent(DomainEvent):
     """Fired when a button is released."""
+    __slots__ = ()
+
     def __init__(self, button_color: str, source: str = "hardware"):
         super().__init__(
             event_type="button_released",
@@ -57,9 +60,10 @@ class ButtonReleasedEvent(DomainEvent):
         )
 
 
-@dataclass
 class GoButtonPressedEvent(DomainEvent):
     """Fired when the main Go button is pressed."""
+    __slots__ = ()
+
     def __init__(self, source: str = "hardware"):
         super().__init__(
             event_type="go_button_pressed",
@@ -70,9 +74,10 @@ class GoButtonPressedEvent(DomainEvent):
 
 
 # App Events
-@dataclass
 class AppStartedEvent(DomainEvent):
     """Fired when an app starts running."""
+    __slots__ = ()
+
     def __init__(self, app_name: str, switch_value: int, source: str = "app_manager"):
         super().__init__(
             event_type="app_started",
@@ -82,9 +87,10 @@ class AppStartedEvent(DomainEvent):
         )
 
 
-@dataclass
 class AppStoppedEvent(DomainEvent):
     """Fired when an app stops running."""
+    __slots__ = ()
+
     def __init__(self, app_name: str, switch_value: int, reason: str = "normal", source: str = "app_manager"):
         super().__init__(
             event_type="app_stopped",
@@ -94,9 +100,10 @@ class AppStoppedEvent(DomainEvent):
         )
 
 
-@dataclass
 class AppErrorEvent(DomainEvent):
     """Fired when an app encounters an error."""
+    __slots__ = ()
+
     def __init__(self, app_name: str, switch_value: int, error: str, source: str = "app_manager"):
         super().__init__(
             event_type="app_error",
@@ -107,9 +114,10 @@ class AppErrorEvent(DomainEvent):
 
 
 # System Events
-@dataclass
 class SystemStartedEvent(DomainEvent):
     """Fired when the BOSS system starts."""
+    __slots__ = ()
+
     def __init__(self, hardware_type: str, source: str = "system"):
         super().__init__(
             event_type="system_started",
@@ -119,9 +127,10 @@ class SystemStartedEvent(DomainEvent):
         )
 
 
-@dataclass
 class SystemShutdownEvent(DomainEvent):
     """Fired when the BOSS system is shutting down."""
+    __slots__ = ()
+
     def __init__(self, reason: str = "user_request", source: str = "system"):
         super().__init__(
             event_type="system_shutdown",
@@ -132,9 +141,10 @@ class SystemShutdownEvent(DomainEvent):
 
 
 # Display Events
-@dataclass
 class DisplayUpdateEvent(DomainEvent):
     """Fired when the display should be updated."""
+    __slots__ = ()
+
     def __init__(self, value: Optional[int], brightness: float = 1.0, source: str = "system"):
         super().__init__(
             event_type="display_update",
@@ -144,9 +154,10 @@ class DisplayUpdateEvent(DomainEvent):
         )
 
 
-@dataclass
 class LedUpdateEvent(DomainEvent):
     """Fired when an LED should be updated."""
+    __slots__ = ()
+
     def __init__(self, color: str, is_on: bool, brightness: float = 1.0, source: str = "system"):
         super().__init__(
             event_type="led_update",
@@ -156,9 +167,10 @@ class LedUpdateEvent(DomainEvent):
         )
 
 
-@dataclass
 class ScreenUpdateEvent(DomainEvent):
     """Fired when the screen should be updated."""
+    __slots__ = ()
+
     def __init__(self, content_type: str, content: Any, source: str = "app"):
         super().__init__(
             event_type="screen_update",
@@ -6,12 +6,22 @@ import logging
 import threading
 import time
 from typing import Optional
-from boss.core.models import HardwareState, SwitchState
+from boss.core.models import HardwareState, SwitchState, ButtonColor, ButtonState, LedColor
 from boss.core.interfaces.services import HardwareService
 from boss.core.interfaces.hardware import HardwareFactory
 
 logger = logging.getLogger(__name__)
 
+# Colour name -> LedColor, so LED updates resolve with one dict lookup
+_LED_COLORS = {color.value: color for color in LedColor}
+
+# A state snapshot younger than this (seconds) is served without re-reading
+# the hardware; matches the GPIO polling interval
+_STATE_MAX_AGE = 0.1
+
+# Bound once: read on every state query and poll cycle
+_monotonic = time.monotonic
+
 
 class HardwareManager(HardwareService):
     """Service for coordinating all hardware components."""
@@ -32,10 +42,14 @@ class HardwareManager(HardwareService):
         # Monitoring
         self._monitoring_thread: Optional[threading.Thread] = None
         self._monitoring_active = False
+        self._monitoring_wakeup = threading.Event()
         self._last_switch_value = 0
         
-        # State
+        # State snapshot; input callbacks mark it dirty so changes are never
+        # served stale, otherwise it is reused for up to _STATE_MAX_AGE
         self._hardware_state = HardwareState.create_default()
+        self._state_dirty = True
+        self._state_time = 0.0
     
     def initialize(self) -> None:
         """Initialize all hardware components."""
@@ -132,8 +146,9 @@ class HardwareManager(HardwareService):
         logger.info("Hardware cleanup complete")
     
     def get_hardware_state(self) -> HardwareState:
-        """Get current state of all hardware."""
-        self._update_hardware_state()
+        """Get current state of all hardware (shared snapshot, refreshed when stale)."""
+        if self._state_dirty or _monotonic() - self._state_time >= _STATE_MAX_AGE:
+            self._update_hardware_state()
         return self._hardware_state
     
     def start_monitoring(self) -> None:
@@ -142,6 +157,7 @@ class HardwareManager(HardwareService):
             return
         
         self._monitoring_active = True
+        self._monitoring_wakeup.clear()
         self._monitoring_thread = threading.Thread(
             target=self._monitor_hardware,
             daemon=True,
@@ -156,6 +172,7 @@ class HardwareManager(HardwareService):
             return
         
         self._monitoring_active = False
+        self._monitoring_wakeup.set()
         
         if self._monitoring_thread and self._monitoring_thread.is_alive():
             self._monitoring_thread.join(timeout=2.0)
@@ -175,12 +192,12 @@ class HardwareManager(HardwareService):
             
             # Color button callbacks
             if self.buttons:
-                from boss.core.models import ButtonColor
+                # Resolve each color's string once at bind time
                 for color in ButtonColor:
-                    self.buttons.set_press_callback(color, 
-                        lambda c=color: self._on_button_pressed(c.value))
+                    self.buttons.set_press_callback(color,
+                        lambda _c=None, v=color.value: self._on_button_pressed(v))
                     self.buttons.set_release_callback(color,
-                        lambda c=color: self._on_button_released(c.value))
+                        lambda _c=None, v=color.value: self._on_button_released(v))
             
             # Switch change callback
             if self.switches:
@@ -192,21 +209,26 @@ class HardwareManager(HardwareService):
     def _on_go_button_pressed(self) -> None:
         """Handle Go button press."""
         logger.debug("Go button pressed")
+        self._state_dirty = True
         self.event_bus.publish("go_button_pressed", {}, "hardware")
     
     def _on_button_pressed(self, color: str) -> None:
         """Handle color button press."""
-        logger.debug(f"{color} button pressed")
+        logger.debug("%s button pressed", color)
+        self._state_dirty = True
         self.event_bus.publish("button_pressed", {"button": color}, "hardware")
     
     def _on_button_released(self, color: str) -> None:
         """Handle color button release."""
-        logger.debug(f"{color} button released")
-        self.event_bus.publish("button_released", {"button": color}, "hardware")
+        logger.debug("%s button released", color)
+        self._state_dirty = True
+        if self.event_bus.has_subscribers("button_released"):
+            self.event_bus.publish("button_released", {"button": color}, "hardware")
     
     def _on_switch_changed(self, old_value: int, new_value: int) -> None:
         """Handle switch change."""
-        logger.debug(f"Switches changed: {old_value} -> {new_value}")
+        logger.debug("Switches changed: %s -> %s", old_value, new_value)
+        self._state_dirty = True
         self.event_bus.publish("switch_changed", {
             "old_value": old_value,
             "new_value": new_value
@@ -217,10 +239,15 @@ class HardwareManager(HardwareService):
         """Monitor hardware in background thread."""
         logger.info("Hardware monitoring thread started")
         
+        # Backends that push every switch change via callback need no polling;
+        # the loop then only does slow housekeeping.
+        switches_push = getattr(self.switches, 'pushes_changes', False) is True
+        interval = 1.0 if switches_push else 0.1  # 10Hz polling for GPIO
+        
         while self._monitoring_active:
             try:
                 # Check switches for changes
-                if self.switches:
+                if self.switches and not switches_push:
                     switch_state = self.switches.read_switches()
                     if switch_state.value != self._last_switch_value:
                         self._on_switch_changed(self._last_switch_value, switch_state.value)
@@ -234,17 +261,19 @@ class HardwareManager(HardwareService):
                 # Update hardware state
                 self._update_hardware_state()
                 
-                # Sleep briefly
-                time.sleep(0.1)  # 10Hz monitoring
+                # Sleep until the next cycle (stop_monitoring wakes us early)
+                self._monitoring_wakeup.wait(interval)
                 
             except Exception as e:
                 logger.error(f"Error in hardware monitoring: {e}")
-                time.sleep(1.0)  # Wait longer on error
+                self._monitoring_wakeup.wait(1.0)  # Wait longer on error
         
         logger.info("Hardware monitoring thread stopped")
     
     def _update_hardware_state(self) -> None:
         """Update internal hardware state."""
+        # Clear before reading so a change arriving mid-read re-dirties it
+        self._state_dirty = False
         try:
             # Read switch state
             if self.switches:
@@ -252,10 +281,13 @@ class HardwareManager(HardwareService):
             
             # Read button states
             if self.buttons:
-                from boss.core.models import ButtonColor, ButtonState
+                button_states = self._hardware_state.buttons
                 for color in ButtonColor:
                     is_pressed = self.buttons.is_pressed(color)
-                    self._hardware_state.buttons[color] = ButtonState(
+                    previous = button_states.get(color)
+                    if not is_pressed and previous is not None and not previous.is_pressed:
+                        continue  # still released: keep the existing state object
+                    button_states[color] = ButtonState(
                         color=color,
                         is_pressed=is_pressed,
                         last_press_time=time.time() if is_pressed else None
@@ -267,15 +299,16 @@ class HardwareManager(HardwareService):
             
             # LED states are managed by events, so we don't read them here
             
+            self._state_time = _monotonic()
         except Exception as e:
+            self._state_dirty = True
             logger.error(f"Error updating hardware state: {e}")
     
     def update_led(self, color: str, is_on: bool, brightness: float = 1.0) -> None:
         """Update LED state."""
         try:
             if self.leds:
-                from boss.core.models import LedColor
-                led_color = LedColor(color)
+                led_color = _LED_COLORS.get(color) or LedColor(color)
                 self.leds.set_led(led_color, is_on, brightness)
                 logger.debug(f"LED {color} {'on' if is_on else 'off'}")
         except Exception as e:
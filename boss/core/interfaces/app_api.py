@@ -4,13 +4,14 @@ App API interfaces (relocated to boss.core.interfaces).
 
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Callable
+from boss.core.interfaces.hardware import ScreenSize
 
 
 class EventBusInterface(ABC):
     """Interface for the event bus accessible to mini-apps."""
     
     @abstractmethod
-    def subscribe(self, event_type: str, handler: Callable, filter_dict: Optional[Dict[str, Any]] = None) -> str:
+    def subscribe(self, event_type: str, handler: Callable, filter_dict: Optional[Dict[str, Any]] = None) -> int:
         """
         Subscribe to events.
         Returns subscription ID for unsubscribing.
@@ -18,7 +19,7 @@ class EventBusInterface(ABC):
         pass
     
     @abstractmethod
-    def unsubscribe(self, subscription_id: str) -> None:
+    def unsubscribe(self, subscription_id: int) -> None:
         """Unsubscribe from events."""
         pass
     
@@ -48,7 +49,7 @@ class ScreenAPIInterface(ABC):
         pass
     
     @abstractmethod
-    def get_screen_size(self) -> tuple:
+    def get_screen_size(self) -> ScreenSize:
         """Get screen dimensions (width, height)."""
         pass
 
@@ -74,6 +75,8 @@ class HardwareAPIInterface(ABC):
 
 class AppAPIInterface(ABC):
     """Complete API interface provided to mini-apps."""
+
+    __slots__ = ()
     
     @property
     @abstractmethod
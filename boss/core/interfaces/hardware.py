@@ -3,7 +3,7 @@ Hardware abstraction interfaces (relocated to boss.core.interfaces).
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, NamedTuple, Optional, Callable
 from boss.core.models import LedColor, ButtonColor, LedState, ButtonState, DisplayState, SwitchState
 
 
@@ -82,6 +82,10 @@ class LedInterface(HardwareComponent):
 class SwitchInterface(HardwareComponent):
     """Interface for switch array hardware."""
     
+    # True when the backend invokes the change callback on every transition,
+    # so callers do not need to poll read_switches() to detect changes.
+    pushes_changes: bool = False
+    
     @abstractmethod
     def read_switches(self) -> SwitchState:
         """Read current switch state."""
@@ -117,6 +121,12 @@ class DisplayInterface(HardwareComponent):
         pass
 
 
+class ScreenSize(NamedTuple):
+    """Screen dimensions in pixels; unpacks like the (width, height) tuple."""
+    width: int
+    height: int
+
+
 class ScreenInterface(HardwareComponent):
     """Interface for main screen hardware."""
     
@@ -137,7 +147,7 @@ class ScreenInterface(HardwareComponent):
         pass
     
     @abstractmethod
-    def get_screen_size(self) -> tuple:
+    def get_screen_size(self) -> ScreenSize:
         """Get screen dimensions (width, height)."""
         pass
 
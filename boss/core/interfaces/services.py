@@ -3,12 +3,15 @@ Service interfaces for B.O.S.S. (relocated to boss.core.interfaces).
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from boss.core.models import App, AppStatus, HardwareState
 
 
 class EventBusService(ABC):
-    """Interface for the event bus service."""
+    """Interface for the event bus service.
+
+    Implementations intern ``event_type`` strings on publish/subscribe.
+    """
     
     @abstractmethod
     def start(self) -> None:
@@ -25,19 +28,33 @@ class EventBusService(ABC):
         """Publish an event."""
         pass
     
+    def publish_conflating(self, event_type: str, conflation_key: Any, payload: Dict, source: str = "system") -> None:
+        """Publish a state event that may replace a still-queued one with the same key.
+
+        The default implementation does not conflate.
+        """
+        self.publish(event_type, payload, source)
+    
     @abstractmethod
-    def subscribe(self, event_type: str, handler, filter_dict: Optional[Dict] = None) -> str:
+    def has_subscribers(self, event_type: str) -> bool:
+        """Check whether a publish of this event type would be delivered."""
+        pass
+    
+    @abstractmethod
+    def subscribe(self, event_type: str, handler, filter_dict: Optional[Dict] = None) -> int:
         """Subscribe to events. Returns subscription ID."""
         pass
     
     @abstractmethod
-    def unsubscribe(self, subscription_id: str) -> None:
+    def unsubscribe(self, subscription_id: int) -> None:
         """Unsubscribe from events."""
         pass
 
 
 class AppManagerService(ABC):
     """Interface for the app manager service."""
+
+    __slots__ = ()
     
     @abstractmethod
     def load_apps(self) -> None:
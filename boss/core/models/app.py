@@ -2,23 +2,60 @@
 Mini-app models and business rules for B.O.S.S.
 """
 
-from dataclasses import dataclass
-from enum import Enum
+from collections import OrderedDict
+from dataclasses import InitVar, dataclass, field, fields, replace
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import AbstractSet, Dict, Any, Optional, List, Tuple
 import json
+import os
+import sys
+import threading
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
 
+# Parse raw file bytes directly; orjson when available, stdlib json otherwise
+_loads = orjson.loads if orjson is not None else json.loads
 
-class AppStatus(Enum):
-    """Status of a mini-app."""
-    STOPPED = "stopped"
-    STARTING = "starting"
-    RUNNING = "running"
-    STOPPING = "stopping"
-    ERROR = "error"
+# Parsed manifests keyed by (path, st_mtime_ns, st_size); bounded LRU
+_MANIFEST_CACHE: "OrderedDict[Tuple[str, int, int], AppManifest]" = OrderedDict()
+_MANIFEST_CACHE_MAX = 512
+_MANIFEST_CACHE_LOCK = threading.Lock()
 
 
-@dataclass
+class AppStatus(IntEnum):
+    """Status of a mini-app.
+
+    Values are distinct bits so status-set checks are a single AND;
+    serialized form is the lower-cased name.
+    """
+    STOPPED = 1
+    STARTING = 2
+    RUNNING = 4
+    STOPPING = 8
+    ERROR = 16
+
+
+# STOPPING counts as running to avoid racey relaunches during graceful shutdown
+_RUNNING_MASK = AppStatus.STARTING | AppStatus.RUNNING | AppStatus.STOPPING
+_CAN_START_MASK = AppStatus.STOPPED | AppStatus.ERROR
+
+# Lifecycle table: (action, current status) -> next status; absent pairs are invalid
+_NEXT_STATUS: Dict[Tuple[str, AppStatus], AppStatus] = {
+    **{("start", s): AppStatus.STARTING for s in AppStatus if s & _CAN_START_MASK},
+    ("run", AppStatus.STARTING): AppStatus.RUNNING,
+    **{("stop", s): AppStatus.STOPPING for s in AppStatus if s & _RUNNING_MASK},
+}
+_TRANSITION_ERRORS = {
+    "start": "Cannot start app in status {}",
+    "run": "Cannot mark running from status {}",
+    "stop": "Cannot stop app in status {}",
+}
+
+
+@dataclass(slots=True)
 class AppManifest:
     """Manifest metadata for a mini-app.
 
@@ -37,6 +74,8 @@ class AppManifest:
     # New: timeout behavior controls what happens when timeout occurs
     # Values: 'return' (stop and show startup), 'rerun' (restart app), 'none' (disable timeout)
     timeout_behavior: str = "return"
+    # Delay before a 'rerun' relaunch after timeout
+    timeout_cooldown_seconds: float = 1
     requires_network: bool = False
     requires_audio: bool = False
     tags: Optional[List[str]] = None
@@ -53,34 +92,54 @@ class AppManifest:
     
     @classmethod
     def from_file(cls, manifest_path: Path) -> "AppManifest":
-        """Load manifest from JSON file."""
+        """Load manifest from JSON file.
+
+        Results are cached until the file's mtime or size changes, so
+        reloading unchanged apps skips the parse. Each call returns its own
+        copy; the cached instance is never handed out.
+        """
         try:
-            with open(manifest_path, 'r') as f:
-                data = json.load(f)
-            
-            # Handle different manifest formats
-            # Map legacy format fields to new format
-            if "id" in data and "name" not in data:
-                data["name"] = data.get("title", data["id"])
-            if "title" in data and "name" not in data:
-                data["name"] = data["title"]
-            
-            # Provide defaults for required fields if missing
-            if "version" not in data:
-                data["version"] = "1.0.0"
-            if "author" not in data:
-                data["author"] = "Unknown"
+            st = os.stat(manifest_path)
+        except FileNotFoundError as e:
+            raise ValueError(f"Invalid manifest file {manifest_path}: {e}")
+        key = (str(manifest_path), st.st_mtime_ns, st.st_size)
+        with _MANIFEST_CACHE_LOCK:
+            cached = _MANIFEST_CACHE.get(key)
+            if cached is not None:
+                _MANIFEST_CACHE.move_to_end(key)
+                return cached._copy()
+        
+        manifest = cls._parse_file(manifest_path)
+        with _MANIFEST_CACHE_LOCK:
+            _MANIFEST_CACHE[key] = manifest
+            if len(_MANIFEST_CACHE) > _MANIFEST_CACHE_MAX:
+                _MANIFEST_CACHE.popitem(last=False)
+        return manifest._copy()
+    
+    def _copy(self) -> "AppManifest":
+        """Copy with its own list fields, so callers cannot alter the cached entry."""
+        return replace(
+            self,
+            tags=list(self.tags),
+            external_apis=list(self.external_apis),
+            required_env=list(self.required_env),
+        )
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached manifests."""
+        with _MANIFEST_CACHE_LOCK:
+            _MANIFEST_CACHE.clear()
+    
+    @classmethod
+    def _parse_file(cls, manifest_path: Path) -> "AppManifest":
+        """Parse a manifest JSON file (uncached)."""
+        try:
+            data = _normalize_manifest_data(_loads(Path(manifest_path).read_bytes()))
             
             # Remove unknown fields that would cause TypeError
-            known_fields = {
-                "name", "description", "version", "author", "entry_point",
-                "timeout_seconds", "timeout_behavior", "requires_network", "requires_audio", "tags",
-                "external_apis", "required_env",
-            }
-            filtered_data = {k: v for k, v in data.items() if k in known_fields}
-            
-            return cls(**filtered_data)
-        except (FileNotFoundError, json.JSONDecodeError, TypeError) as e:
+            return cls(**{k: data[k] for k in data.keys() & _MANIFEST_FIELDS})
+        except (FileNotFoundError, json.JSONDecodeError, TypeError, AttributeError) as e:
             raise ValueError(f"Invalid manifest file {manifest_path}: {e}")
     
     def to_dict(self) -> Dict[str, Any]:
@@ -100,7 +159,30 @@ class AppManifest:
         }
 
 
-@dataclass
+# Keys accepted from manifest.json (everything else is ignored)
+_MANIFEST_FIELDS = frozenset(f.name for f in fields(AppManifest) if f.init)
+
+
+def _normalize_manifest_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map legacy manifest keys (id/title) to 'name' and fill required defaults."""
+    if "name" not in data:
+        if "title" in data:
+            data["name"] = data["title"]
+        elif "id" in data:
+            data["name"] = data["id"]
+    data.setdefault("version", "1.0.0")
+    data.setdefault("author", "Unknown")
+    # Intern enum-like strings so comparisons against literals hit the identity fast path
+    behavior = data.get("timeout_behavior")
+    if type(behavior) is str:
+        data["timeout_behavior"] = sys.intern(behavior)
+    tags = data.get("tags")
+    if type(tags) is list:
+        data["tags"] = [sys.intern(t) if type(t) is str else t for t in tags]
+    return data
+
+
+@dataclass(slots=True)
 class App:
     """A mini-app entity with its metadata and runtime state."""
     switch_value: int  # 0-255
@@ -109,16 +191,27 @@ class App:
     status: AppStatus = AppStatus.STOPPED
     last_run_time: Optional[float] = None
     error_message: Optional[str] = None
+    # Names already listed from app_path by the loader; lets validation skip stats
+    dir_entries: InitVar[Optional[AbstractSet[str]]] = None
+    _app_path_str: str = field(default="", init=False, repr=False, compare=False)
     
-    def __post_init__(self):
-        """Validate app configuration."""
+    def __post_init__(self, dir_entries: Optional[AbstractSet[str]] = None):
+        """Validate app configuration.
+
+        When ``dir_entries`` is given, ``app_path`` is known to exist and an
+        entry point found in it needs no further ``stat``.
+        """
         if not 0 <= self.switch_value <= 255:
             raise ValueError(f"Switch value must be 0-255, got {self.switch_value}")
+        self._app_path_str = str(self.app_path)
         
-        if not self.app_path.exists():
+        if dir_entries is None and not self.app_path.exists():
             raise ValueError(f"App path does not exist: {self.app_path}")
         
-        entry_point_path = self.app_path / self.manifest.entry_point
+        entry_point = self.manifest.entry_point
+        if dir_entries is not None and entry_point in dir_entries:
+            return
+        entry_point_path = self.app_path / entry_point
         if not entry_point_path.exists():
             raise ValueError(f"Entry point does not exist: {entry_point_path}")
     
@@ -129,35 +222,32 @@ class App:
         Treat STOPPING as still running to avoid racey relaunches during
         graceful shutdown windows.
         """
-        return self.status in (
-            AppStatus.STARTING,
-            AppStatus.RUNNING,
-            AppStatus.STOPPING,
-        )
+        return bool(self.status & _RUNNING_MASK)
     
     @property
     def can_start(self) -> bool:
         """Check if the app can be started."""
-        return self.status in (AppStatus.STOPPED, AppStatus.ERROR)
+        return bool(self.status & _CAN_START_MASK)
+    
+    def _transition(self, action: str) -> None:
+        """Advance status via the lifecycle table or raise ValueError."""
+        new_status = _NEXT_STATUS.get((action, self.status))
+        if new_status is None:
+            raise ValueError(_TRANSITION_ERRORS[action].format(self.status.name))
+        self.status = new_status
     
     def mark_starting(self) -> None:
         """Mark app as starting."""
-        if not self.can_start:
-            raise ValueError(f"Cannot start app in status {self.status}")
-        self.status = AppStatus.STARTING
+        self._transition("start")
         self.error_message = None
     
     def mark_running(self) -> None:
         """Mark app as running."""
-        if self.status != AppStatus.STARTING:
-            raise ValueError(f"Cannot mark running from status {self.status}")
-        self.status = AppStatus.RUNNING
+        self._transition("run")
     
     def mark_stopping(self) -> None:
         """Mark app as stopping."""
-        if not self.is_running:
-            raise ValueError(f"Cannot stop app in status {self.status}")
-        self.status = AppStatus.STOPPING
+        self._transition("stop")
     
     def mark_stopped(self) -> None:
         """Mark app as stopped."""
@@ -174,8 +264,8 @@ class App:
         return {
             "switch_value": self.switch_value,
             "manifest": self.manifest.to_dict(),
-            "app_path": str(self.app_path),
-            "status": self.status.value,
+            "app_path": self._app_path_str,
+            "status": self.status.name.lower(),
             "last_run_time": self.last_run_time,
             "error_message": self.error_message
         }
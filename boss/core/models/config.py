@@ -2,13 +2,34 @@
 Configuration models for B.O.S.S.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import json
+import os
+import threading
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
 
+# Parse raw file bytes directly; orjson when available, stdlib json otherwise
+_loads = orjson.loads if orjson is not None else json.loads
 
-@dataclass
+
+# Bytes last written per path, with the file's (st_mtime_ns, st_size) after the write
+_LAST_SAVED: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+_LAST_SAVED_LOCK = threading.Lock()
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+@dataclass(slots=True)
 class HardwareConfig:
     """Hardware configuration settings."""
     # GPIO pin assignments
@@ -41,7 +62,7 @@ class HardwareConfig:
     screen_wrap_width_chars: int = 80
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemConfig:
     """System-wide configuration settings."""
     # App settings
@@ -74,7 +95,42 @@ class SystemConfig:
     location: Optional[dict] = None
 
 
-@dataclass
+def _make_codecs(cls, defaults: Dict[str, Any]):
+    """Generate (load, dump) functions specialised to a config dataclass.
+
+    ``load(section)`` passes every field by keyword: required fields by
+    subscript (a missing key raises KeyError naming it), optional ones via
+    ``.get`` with their default. Unknown keys are ignored. ``dump(obj)``
+    returns a shallow dict in declaration order (slotted classes have no
+    ``__dict__``).
+    """
+    namespace: Dict[str, Any] = {"cls": cls}
+    args = []
+    for f in fields(cls):
+        if f.name in defaults:
+            namespace[f"_d_{f.name}"] = defaults[f.name]
+        elif f.default is not MISSING:
+            namespace[f"_d_{f.name}"] = f.default
+        else:
+            args.append(f"{f.name}=d[{f.name!r}]")
+            continue
+        args.append(f"{f.name}=d.get({f.name!r}, _d_{f.name})")
+    items = ", ".join(f"{f.name!r}: o.{f.name}" for f in fields(cls))
+    source = (
+        f"def load(d):\n    return cls({', '.join(args)})\n"
+        f"def dump(o):\n    return {{{items}}}\n"
+    )
+    exec(compile(source, f"<{cls.__name__} codecs>", "exec"), namespace)
+    return namespace["load"], namespace["dump"]
+
+
+# Values applied when a key is absent from the file (beyond dataclass defaults)
+_HARDWARE_DEFAULTS: Dict[str, Any] = {"screen_backend": "rich"}
+_load_hardware, _dump_hardware = _make_codecs(HardwareConfig, _HARDWARE_DEFAULTS)
+_load_system, _dump_system = _make_codecs(SystemConfig, {})
+
+
+@dataclass(slots=True)
 class BossConfig:
     """Complete B.O.S.S. configuration."""
     hardware: HardwareConfig
@@ -84,8 +140,7 @@ class BossConfig:
     def from_file(cls, config_path: Path) -> "BossConfig":
         """Load configuration from JSON file. All values must be present."""
         try:
-            with open(config_path, 'r') as f:
-                data = json.load(f)
+            data = _loads(Path(config_path).read_bytes())
             
             # All sections must be present
             if 'hardware' not in data:
@@ -93,47 +148,8 @@ class BossConfig:
             if 'system' not in data:
                 raise ValueError("Missing 'system' section in configuration")
             
-            hardware_data = data['hardware']
-            system_data = data['system']
-            
-            # Create hardware config - all values required
-            hardware_config = HardwareConfig(
-                switch_data_pin=hardware_data['switch_data_pin'],
-                switch_select_pins=hardware_data['switch_select_pins'],
-                go_button_pin=hardware_data['go_button_pin'],
-                button_pins=hardware_data['button_pins'],
-                led_pins=hardware_data['led_pins'],
-                display_clk_pin=hardware_data['display_clk_pin'],
-                display_dio_pin=hardware_data['display_dio_pin'],
-                screen_width=hardware_data['screen_width'],
-                screen_height=hardware_data['screen_height'],
-                screen_fullscreen=hardware_data['screen_fullscreen'],
-                screen_backend=hardware_data.get('screen_backend', 'rich'),
-                enable_audio=hardware_data['enable_audio'],
-                audio_volume=hardware_data['audio_volume'],
-                led_active_high=hardware_data.get('led_active_high', True),
-                screen_wrap_width_chars=hardware_data.get('screen_wrap_width_chars', 80)
-            )
-            
-            # Create system config - all values required
-            system_config = SystemConfig(
-                app_timeout_seconds=system_data['app_timeout_seconds'],
-                apps_directory=system_data['apps_directory'],
-                log_level=system_data['log_level'],
-                log_file=system_data['log_file'],
-                log_max_size_mb=system_data['log_max_size_mb'],
-                log_backup_count=system_data['log_backup_count'],
-                event_queue_size=system_data['event_queue_size'],
-                event_timeout_seconds=system_data['event_timeout_seconds'],
-                webui_enabled=system_data['webui_enabled'],
-                webui_host=system_data['webui_host'],
-                webui_port=system_data['webui_port'],
-                enable_api=system_data['enable_api'],
-                api_port=system_data['api_port'],
-                auto_detect_hardware=system_data['auto_detect_hardware'],
-                force_hardware_type=system_data['force_hardware_type'],
-                location=system_data.get('location')
-            )
+            hardware_config = _load_hardware(data['hardware'])
+            system_config = _load_system(data['system'])
             
             return cls(hardware=hardware_config, system=system_config)
             
@@ -143,20 +159,38 @@ class BossConfig:
             raise ValueError(f"Invalid configuration file: {e}")
     
     def save_to_file(self, config_path: Path) -> None:
-        """Save configuration to JSON file."""
+        """Save configuration to JSON file.
+
+        The write is skipped when the encoded config matches what this
+        process last wrote and the file has not changed since.
+        """
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
         data = {
-            "hardware": self.hardware.__dict__,
-            "system": self.system.__dict__
+            "hardware": _dump_hardware(self.hardware),
+            "system": _dump_system(self.system)
         }
+        payload = _dumps(data)
+        
+        key = str(config_path)
+        with _LAST_SAVED_LOCK:
+            last = _LAST_SAVED.get(key)
+        if last is not None and last[1] == payload:
+            try:
+                st = os.stat(config_path)
+                if (st.st_mtime_ns, st.st_size) == last[0]:
+                    return
+            except OSError:
+                pass
         
-        with open(config_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        config_path.write_bytes(payload)
+        st = os.stat(config_path)
+        with _LAST_SAVED_LOCK:
+            _LAST_SAVED[key] = ((st.st_mtime_ns, st.st_size), payload)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
-            "hardware": self.hardware.__dict__,
-            "system": self.system.__dict__
+            "hardware": _dump_hardware(self.hardware),
+            "system": _dump_system(self.system)
         }
@@ -23,19 +23,24 @@ class ButtonColor(Enum):
     BLUE = "blue"
 
 
-@dataclass
+@dataclass(slots=True)
 class SwitchState:
     """Current state of the 8-bit switch array."""
-    value: int  # 0-255
-    individual_switches: Dict[int, bool]  # switch_number -> on/off
+    value: int  # 0-255; bit i is switch i
     
     def __post_init__(self):
         """Validate switch state consistency."""
         if not 0 <= self.value <= 255:
             raise ValueError(f"Switch value must be 0-255, got {self.value}")
+    
+    @property
+    def individual_switches(self) -> Dict[int, bool]:
+        """Switch number -> on/off, unpacked from ``value`` on demand."""
+        value = self.value
+        return {i: (value >> i) & 1 == 1 for i in range(8)}
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonState:
     """State of a single button."""
     color: ButtonColor
@@ -43,7 +48,7 @@ class ButtonState:
     last_press_time: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LedState:
     """State of a single LED."""
     color: LedColor
@@ -56,7 +61,7 @@ class LedState:
             raise ValueError(f"LED brightness must be 0.0-1.0, got {self.brightness}")
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplayState:
     """State of the 7-segment display."""
     value: Optional[int] = None  # Number to display (0-9999) or None for blank
@@ -71,7 +76,7 @@ class DisplayState:
             raise ValueError(f"Display brightness must be 0.0-1.0, got {self.brightness}")
 
 
-@dataclass
+@dataclass(slots=True)
 class HardwareState:
     """Complete state of all hardware components."""
     switches: SwitchState
@@ -84,7 +89,7 @@ class HardwareState:
     def create_default(cls) -> "HardwareState":
         """Create default hardware state with all components off/inactive."""
         return cls(
-            switches=SwitchState(value=0, individual_switches={i: False for i in range(8)}),
+            switches=SwitchState(value=0),
             buttons={color: ButtonState(color=color, is_pressed=False) for color in ButtonColor},
             leds={color: LedState(color=color, is_on=False) for color in LedColor},
             display=DisplayState(value=0),
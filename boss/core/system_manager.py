@@ -4,6 +4,7 @@ System Service - Manages overall system lifecycle and coordination.
 
 import logging
 import os
+import queue
 import signal
 import sys
 import threading
@@ -26,6 +27,12 @@ class SystemManager(SystemService):
         self._running = False
         self._shutdown_event = threading.Event()
         self._webui_port = None  # Track dev UI port for shutdown (if any)
+        # Launcher thread: runs slow handlers (app switches, shutdown) off the
+        # event bus worker so they don't block delivery of other events
+        self._launcher_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._launcher_thread: Optional[threading.Thread] = None
+        # Set by stop(); queued and newly submitted launcher work is dropped
+        self._launcher_stopped = threading.Event()
     # Legacy backend switching removed; attribute retained previously is now unnecessary.
 
         # Set up signal handlers for graceful shutdown
@@ -51,6 +58,7 @@ class SystemManager(SystemService):
         try:
             # Start event bus
             self.event_bus.start()
+            self._start_launcher()
             
             # Initialize hardware
             self.hardware_service.initialize()
@@ -126,6 +134,10 @@ class SystemManager(SystemService):
             # Stop WebUI development interface
             self.stop_webui_if_running()
             
+            # Stop launcher thread first so no queued launch can start an app
+            # after the current one is stopped (pending launches are discarded)
+            self._stop_launcher()
+            
             # Stop current app
             self.app_runner.stop_current_app()
             
@@ -148,6 +160,67 @@ class SystemManager(SystemService):
     
     # WebUI-specific helper removed; factory handles dev UI lifecycle
     
+    def _start_launcher(self) -> None:
+        """Start the thread that runs work submitted via _run_off_bus()."""
+        if self._launcher_thread and self._launcher_thread.is_alive():
+            return
+        self._launcher_stopped.clear()
+        self._launcher_queue = queue.SimpleQueue()
+        self._launcher_thread = threading.Thread(
+            target=self._launcher_loop,
+            args=(self._launcher_queue,),
+            name="SystemLauncher",
+            daemon=True
+        )
+        self._launcher_thread.start()
+    
+    def _stop_launcher(self) -> None:
+        """Stop the launcher thread and discard pending work.
+
+        Never joins itself when called from the launcher thread.
+        """
+        self._launcher_stopped.set()
+        thread = self._launcher_thread
+        if thread is None:
+            return
+        self._launcher_thread = None
+        jobs = self._launcher_queue
+        try:
+            while True:
+                jobs.get_nowait()
+        except queue.Empty:
+            pass
+        jobs.put(None)
+        if thread is not threading.current_thread() and thread.is_alive():
+            thread.join(timeout=2.0)
+    
+    def _launcher_loop(self, jobs: "queue.SimpleQueue") -> None:
+        """Run queued (callable, args) jobs until the None sentinel arrives."""
+        while True:
+            job = jobs.get()
+            if job is None or self._launcher_stopped.is_set():
+                break
+            func, args = job
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("Launcher task failed")
+    
+    def _run_off_bus(self, func, *args) -> None:
+        """Run ``func(*args)`` on the launcher thread.
+
+        Runs inline before start(), so handlers keep working when invoked
+        directly; dropped after stop().
+        """
+        if self._launcher_stopped.is_set():
+            logger.debug("Launcher stopped; dropping %s", getattr(func, "__name__", func))
+            return
+        thread = self._launcher_thread
+        if thread is None or not thread.is_alive():
+            func(*args)
+            return
+        self._launcher_queue.put((func, args))
+    
     def stop_webui_if_running(self) -> None:
         """Stop WebUI development interface if it's running."""
         if self._webui_port:
@@ -289,7 +362,11 @@ class SystemManager(SystemService):
         return None
     
     def _on_app_launch_requested(self, event_type: str, payload: Dict[str, Any]) -> None:
-        """Handle app launch requests."""
+        """Handle app launch requests (the launch itself runs on the launcher thread)."""
+        self._run_off_bus(self._launch_app_for_current_switch)
+
+    def _launch_app_for_current_switch(self) -> None:
+        """Stop the running app and start the one mapped to the current switch value."""
         try:
             # Get current switch value
             hardware_state = self.hardware_service.get_hardware_state()
@@ -378,7 +455,11 @@ class SystemManager(SystemService):
             pass
     
     def _on_go_button_pressed(self, event_type: str, payload: Dict[str, Any]) -> None:
-        """Handle Go button press."""
+        """Handle Go button press (processed on the launcher thread)."""
+        self._run_off_bus(self._handle_go_button_press)
+
+    def _handle_go_button_press(self) -> None:
+        """Snapshot the switches and request an app launch."""
         # Snapshot current switch value immediately to avoid races with the
         # background monitor or multiplexed switch settling. Publish a
         # display_update using the sampled value so the 7-seg shows the
@@ -442,6 +523,10 @@ class SystemManager(SystemService):
             logger.debug("Transition feedback error", exc_info=True)
     
     def _on_system_shutdown_requested(self, event_type: str, payload: Dict[str, Any]) -> None:
+        """Handle system shutdown requests (processed on the launcher thread)."""
+        self._run_off_bus(self._handle_system_shutdown, payload)
+
+    def _handle_system_shutdown(self, payload: Dict[str, Any]) -> None:
         """Handle system shutdown requests from admin apps.
 
         Supported reasons:
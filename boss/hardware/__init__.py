@@ -1,30 +1,12 @@
 """Flat facade for hardware layer (localized).
 
 Primary entry point for hardware factories and common components.
+Exports are imported lazily on first attribute access, so importing the
+facade does not pull in gpiozero, Rich, Textual or WebUI dependencies
+until a backend is actually used.
 """
 
-# Factory helpers
-from .factory import create_hardware_factory, detect_hardware_platform, log_hardware_summary
-
-# Explicitly re-export common factories and components
-from .mock.mock_factory import MockHardwareFactory
-from .gpio.gpio_factory import GPIOHardwareFactory
-from .webui.webui_factory import WebUIHardwareFactory
-
-# Frequently used concrete components for scripts/tests
-from .gpio.gpio_hardware import GPIODisplay
-from .gpio.gpio_screens import GPIORichScreen
-
-# Mock component re-exports for tests and development
-from .mock.mock_hardware import (
-    MockButtons,
-    MockGoButton,
-    MockLeds,
-    MockSwitches,
-    MockDisplay,
-    MockScreen,
-    MockSpeaker,
-)
+import importlib
 
 __all__ = [
     # factory helpers
@@ -47,3 +29,38 @@ __all__ = [
     "MockScreen",
     "MockSpeaker",
 ]
+
+_LAZY_EXPORTS = {
+    # Factory helpers
+    "create_hardware_factory": ".factory",
+    "detect_hardware_platform": ".factory",
+    "log_hardware_summary": ".factory",
+    # Factories
+    "MockHardwareFactory": ".mock.mock_factory",
+    "GPIOHardwareFactory": ".gpio.gpio_factory",
+    "WebUIHardwareFactory": ".webui.webui_factory",
+    # Frequently used concrete components for scripts/tests
+    "GPIODisplay": ".gpio.gpio_hardware",
+    "GPIORichScreen": ".gpio.gpio_screens",
+    # Mock components for tests and development
+    "MockButtons": ".mock.mock_hardware",
+    "MockGoButton": ".mock.mock_hardware",
+    "MockLeds": ".mock.mock_hardware",
+    "MockSwitches": ".mock.mock_hardware",
+    "MockDisplay": ".mock.mock_hardware",
+    "MockScreen": ".mock.mock_hardware",
+    "MockSpeaker": ".mock.mock_hardware",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -2,9 +2,10 @@
 Hardware factory with automatic platform detection (localized).
 """
 
+import functools
 import logging
-import platform
 import os
+import sys
 import importlib.util
 from typing import Optional
 from boss.core.interfaces.hardware import HardwareFactory
@@ -12,21 +13,26 @@ from boss.core.models import HardwareConfig
 
 logger = logging.getLogger(__name__)
 
+# Platform identity, resolved once; the machine name is only needed on Linux
+_IS_LINUX = sys.platform.startswith("linux")
+_MACHINE = os.uname().machine if _IS_LINUX else ""
 
+
+@functools.lru_cache(maxsize=1)
 def detect_hardware_platform() -> str:
     """
     Automatically detect the best hardware implementation to use.
     
+    The result is computed once per process; tests that change
+    ``BOSS_TEST_MODE`` should call ``detect_hardware_platform.cache_clear()``.
+    
     Returns:
         "gpio" for Raspberry Pi with GPIO access
         "webui" for development on other platforms
         "mock" for testing
     """
-    system = platform.system()
-    machine = platform.machine()
-    
     # Check if we're on Raspberry Pi (32/64-bit) and GPIO libraries are available
-    if system == "Linux" and (machine.startswith("arm") or machine == "aarch64"):
+    if _IS_LINUX and (_MACHINE.startswith("arm") or _MACHINE == "aarch64"):
         # Try to detect supported GPIO libraries without importing them
         has_gpiozero = importlib.util.find_spec("gpiozero") is not None
         has_lgpio = importlib.util.find_spec("lgpio") is not None
@@ -54,7 +60,7 @@ def detect_hardware_platform() -> str:
         return "mock"
     
     # Default to WebUI for development
-    logger.info(f"Development platform detected: {system} {machine}")
+    logger.info(f"Development platform detected: {sys.platform} {_MACHINE}".rstrip())
     return "webui"
 
 
@@ -97,7 +103,7 @@ def log_hardware_summary(factory: HardwareFactory, hardware_config: HardwareConf
     logger.info("BOSS Hardware Configuration Summary")
     logger.info("=" * 50)
     logger.info(f"Hardware Type: {factory.hardware_type}")
-    logger.info(f"Platform: {platform.system()} {platform.machine()}")
+    logger.info(f"Platform: {sys.platform} {_MACHINE}".rstrip())
     
     if factory.hardware_type == "gpio":
         logger.info("GPIO Pin Assignments:")
@@ -2,6 +2,8 @@
 GPIO hardware implementations for Raspberry Pi.
 """
 
+import functools
+import importlib.util
 import logging
 import threading
 import time
@@ -9,22 +11,27 @@ from typing import Optional, Callable, Dict
 
 logger = logging.getLogger(__name__)
 
-try:
-    from gpiozero import Device, Button as GZButton, LED as GZLED
-    # Explicitly set pin factory to lgpio for optimal performance and to eliminate warnings
+# Probe for gpiozero without importing it; the import and pin factory setup
+# are deferred until a component is actually initialized.
+HAS_GPIO = importlib.util.find_spec("gpiozero") is not None
+_pin_factory_configured = False
+
+
+def _configure_pin_factory() -> None:
+    """Select the lgpio pin factory once, before the first gpiozero device is created."""
+    global _pin_factory_configured
+    if _pin_factory_configured:
+        return
+    _pin_factory_configured = True
     try:
+        from gpiozero import Device
+        # Explicitly set pin factory to lgpio for optimal performance and to eliminate warnings
         from gpiozero.pins.lgpio import LGPIOFactory
         Device.pin_factory = LGPIOFactory()
         logger.info("Using lgpio pin factory for gpiozero (optimal)")
     except ImportError:
         # Fallback to default factory selection if lgpio not available
         logger.info("lgpio not available, using gpiozero default pin factory")
-    HAS_GPIO = True
-except ImportError:
-    HAS_GPIO = False
-    # Provide stubs to satisfy type checkers when gpiozero isn't available at import time
-    GZButton = None  # type: ignore
-    GZLED = None  # type: ignore
 
 
 from boss.core.interfaces.hardware import (
@@ -56,6 +63,7 @@ class GPIOButtons(ButtonInterface):
         if not HAS_GPIO:
             logger.error("gpiozero not available")
             return False
+        _configure_pin_factory()
         try:
             # Import here to ensure symbols exist only when gpiozero is present
             from gpiozero import Button as GZButton  # type: ignore
@@ -84,14 +92,14 @@ class GPIOButtons(ButtonInterface):
         callback = self._press_callbacks.get(color)
         if callback:
             callback(color)
-        logger.debug(f"GPIO button {color} pressed")
+        logger.debug("GPIO button %s pressed", color)
 
     def _handle_release(self, color: ButtonColor):
         self._button_states[color] = False
         callback = self._release_callbacks.get(color)
         if callback:
             callback(color)
-        logger.debug(f"GPIO button {color} released")
+        logger.debug("GPIO button %s released", color)
     
     def cleanup(self) -> None:
         """Clean up GPIO buttons."""
@@ -143,6 +151,7 @@ class GPIOGoButton(GoButtonInterface):
         if not HAS_GPIO:
             logger.error("gpiozero not available")
             return False
+        _configure_pin_factory()
         try:
             from gpiozero import Button as GZButton
             self._gz_button = GZButton(self.hardware_config.go_button_pin, pull_up=True, bounce_time=0.2)
@@ -214,6 +223,7 @@ class GPIOLeds(LedInterface):
         if not HAS_GPIO:
             logger.error("gpiozero not available")
             return False
+        _configure_pin_factory()
         try:
             from gpiozero import LED as GZLED  # type: ignore
             self._gz_leds = {}
@@ -262,7 +272,7 @@ class GPIOLeds(LedInterface):
             else:
                 led.off()
             self._led_states[color] = LedState(color=color, is_on=is_on, brightness=brightness)
-            logger.debug(f"GPIO LED {color.value}: {'ON' if is_on else 'OFF'} (brightness: {brightness})")
+            logger.debug("GPIO LED %s: %s (brightness: %s)", color.value, "ON" if is_on else "OFF", brightness)
         except Exception as e:
             logger.error(f"Error setting GPIO LED {color}: {e}")
     
@@ -282,7 +292,6 @@ class GPIOSwitches(SwitchInterface):
     def __init__(self, hardware_config: HardwareConfig):
         self.hardware_config = hardware_config
         self._switch_value = 0
-        self._individual_switches = {i: False for i in range(8)}
         self._change_callback: Optional[Callable] = None
         self._available = False
         self._monitoring = False
@@ -293,6 +302,7 @@ class GPIOSwitches(SwitchInterface):
         if not HAS_GPIO:
             logger.error("gpiozero not available")
             return False
+        _configure_pin_factory()
         try:
             from gpiozero import DigitalInputDevice, DigitalOutputDevice
             self._data_pin = DigitalInputDevice(self.hardware_config.switch_data_pin, pull_up=True)
@@ -329,10 +339,9 @@ class GPIOSwitches(SwitchInterface):
     def read_switches(self) -> SwitchState:
         """Read current switch state using gpiozero."""
         if not self.is_available:
-            return SwitchState(value=0, individual_switches={i: False for i in range(8)})
+            return SwitchState(value=0)
         try:
             switch_value = 0
-            individual_switches = {}
             for i in range(8):
                 # Set select pins for current switch
                 for j, pin in enumerate(self._select_pins):
@@ -340,16 +349,13 @@ class GPIOSwitches(SwitchInterface):
                 # Short settle; hardware is fast, keep this tiny
                 time.sleep(0.0005)
                 # Read switch state (active low)
-                switch_on = not self._data_pin.value
-                individual_switches[i] = switch_on
-                if switch_on:
+                if not self._data_pin.value:
                     switch_value |= (1 << i)
             self._switch_value = switch_value
-            self._individual_switches = individual_switches
-            return SwitchState(value=switch_value, individual_switches=individual_switches)
+            return SwitchState(value=switch_value)
         except Exception as e:
             logger.error(f"Error reading GPIO switches (gpiozero): {e}")
-            return SwitchState(value=0, individual_switches={i: False for i in range(8)})
+            return SwitchState(value=0)
     
     def set_change_callback(self, callback: Callable[[int, int], None]) -> None:
         """Set callback for switch change events."""
@@ -390,6 +396,18 @@ class GPIOSwitches(SwitchInterface):
                 time.sleep(1.0)
 
 
+@functools.lru_cache(maxsize=1024)
+def _format4(value: int) -> str:
+    """Right-align a number in the 4-digit display width."""
+    return str(value)[-4:].rjust(4)
+
+
+@functools.lru_cache(maxsize=256)
+def _pad_text4(text: str) -> str:
+    """Truncate/pad text to the 4-digit display width."""
+    return text[:4].ljust(4)
+
+
 class GPIODisplay(DisplayInterface):
     """GPIO 7-segment display implementation (placeholder)."""
     def __init__(self, hardware_config: HardwareConfig):
@@ -398,6 +416,7 @@ class GPIODisplay(DisplayInterface):
         self._last_value = None
         self._brightness = 1.0
         self._tm = None  # Lazy-initialized TM1637 instance
+        self._tm_level: Optional[int] = None  # Brightness step last sent to the TM1637
 
     def initialize(self) -> bool:
         """Initialize TM1637 display using python-tm1637 (gpio)."""
@@ -414,7 +433,9 @@ class GPIODisplay(DisplayInterface):
         try:
             clk = int(self.hardware_config.display_clk_pin)
             dio = int(self.hardware_config.display_dio_pin)
+            # python-tm1637 exposes no bit-delay setting; it uses a fixed 5us internally
             self._tm = TM1637(clk=clk, dio=dio)
+            self._tm_level = None
             # Apply initial brightness mapping (0-1 -> 0-7)
             self._apply_tm_brightness(self._brightness)
             self._available = True
@@ -440,6 +461,7 @@ class GPIODisplay(DisplayInterface):
                 except Exception:
                     pass
             self._tm = None
+            self._tm_level = None
         finally:
             self._available = False
 
@@ -453,6 +475,8 @@ class GPIODisplay(DisplayInterface):
             return
         if not 0 <= value <= 9999:
             raise ValueError(f"Display value must be 0-9999, got {value}")
+        if value == self._last_value and brightness == self._brightness:
+            return  # already showing this; skip the bus transaction
         try:
             self._last_value = value
             self._brightness = brightness
@@ -461,10 +485,10 @@ class GPIODisplay(DisplayInterface):
             if hasattr(self._tm, 'number'):
                 self._tm.number(value)
             else:
-                s = str(value).rjust(4)
+                s = _format4(value)
                 if hasattr(self._tm, 'show'):
                     self._tm.show(s)
-            logger.debug(f"TM1637 display number: {value} (brightness: {brightness})")
+            logger.debug("TM1637 display number: %s (brightness: %s)", value, brightness)
         except Exception as e:
             logger.error(f"Error displaying number on TM1637: {e}")
 
@@ -472,11 +496,13 @@ class GPIODisplay(DisplayInterface):
         """Display text (first 4 chars best-effort)."""
         if not self.is_available or self._tm is None:
             return
+        if text == self._last_value and brightness == self._brightness:
+            return  # already showing this; skip the bus transaction
         try:
             self._last_value = text
             self._brightness = brightness
             self._apply_tm_brightness(brightness)
-            s = (text or "")[:4].ljust(4)
+            s = _pad_text4(text or "")
             # Prefer encode_string/write if available for better segment mapping
             if hasattr(self._tm, 'encode_string') and hasattr(self._tm, 'write'):
                 try:
@@ -488,7 +514,7 @@ class GPIODisplay(DisplayInterface):
                         self._tm.show(s)
             elif hasattr(self._tm, 'show'):
                 self._tm.show(s)
-            logger.debug(f"TM1637 display text: '{s}' (brightness: {brightness})")
+            logger.debug("TM1637 display text: '%s' (brightness: %s)", s, brightness)
         except Exception as e:
             logger.error(f"Error displaying text on TM1637: {e}")
 
@@ -517,13 +543,17 @@ class GPIODisplay(DisplayInterface):
 
     # --- Internal helpers ---
     def _apply_tm_brightness(self, brightness: float) -> None:
-        """Map 0.0-1.0 to TM1637 brightness steps (0-7) and apply."""
+        """Map 0.0-1.0 to TM1637 brightness steps (0-7) and apply.
+
+        The level is only sent when it differs from the last one applied, as
+        each brightness change is its own bus transaction.
+        """
         try:
             level = int(round(max(0.0, min(1.0, float(brightness))) * 7))
         except Exception:
             level = 7
         tm = self._tm
-        if tm is None:
+        if tm is None or level == self._tm_level:
             return
         try:
             if hasattr(tm, 'brightness'):
@@ -531,6 +561,7 @@ class GPIODisplay(DisplayInterface):
                 tm.brightness(level)
             elif hasattr(tm, 'set_brightness'):
                 tm.set_brightness(level)
+            self._tm_level = level
         except Exception:
             # Non-fatal if brightness cannot be applied
             pass
@@ -2,7 +2,7 @@
 
 Pillow framebuffer backend deprecated & removed to simplify maintenance.
 """
-from boss.core.interfaces.hardware import ScreenInterface
+from boss.core.interfaces.hardware import ScreenInterface, ScreenSize
 from boss.core.models import HardwareConfig
 import logging
 import sys
@@ -123,6 +123,7 @@ class GPIORichScreen(ScreenInterface):
         self._available = False
         self._screen_width = hardware_config.screen_width
         self._screen_height = hardware_config.screen_height
+        self._size = ScreenSize(self._screen_width, self._screen_height)
         
         if HAS_RICH:
             # Setup console with framebuffer redirection on Raspberry Pi
@@ -214,8 +215,8 @@ class GPIORichScreen(ScreenInterface):
         self._console.print(f"[Image: {image_path}]", style="bold yellow")  # type: ignore[union-attr]
         logger.info(f"GPIORichScreen image placeholder: {image_path}")
 
-    def get_screen_size(self) -> tuple:
-        return (self._screen_width, self._screen_height)
+    def get_screen_size(self) -> ScreenSize:
+        return self._size
 
     # Rich-specific enhanced features
     def display_table(self, table_data: dict, title: Optional[str] = None) -> None:
@@ -20,7 +20,7 @@ import time
 import queue
 from typing import Optional, List, Dict, Any
 
-from boss.core.interfaces.hardware import ScreenInterface
+from boss.core.interfaces.hardware import ScreenInterface, ScreenSize
 from boss.core.models import HardwareConfig
 
 logger = logging.getLogger(__name__)
@@ -49,6 +49,7 @@ class TextualScreen(ScreenInterface):
         self._available = False
         self._screen_width = hardware_config.screen_width
         self._screen_height = hardware_config.screen_height
+        self._size = ScreenSize(self._screen_width, self._screen_height)
         self._console: Optional[Console] = Console() if HAS_RICH else None  # type: ignore
         self._queue: "queue.Queue[_Cmd]" = queue.Queue()
         self._thread: Optional[threading.Thread] = None
@@ -98,8 +99,8 @@ class TextualScreen(ScreenInterface):
             return
         self._queue.put(_Cmd("clear", {"color": color}))
 
-    def get_screen_size(self) -> tuple:  # pragma: no cover
-        return self._screen_width, self._screen_height
+    def get_screen_size(self) -> ScreenSize:  # pragma: no cover
+        return self._size
 
     # ---- Metrics ----
     def get_metrics(self) -> Dict[str, Any]:
@@ -3,17 +3,19 @@ Mock hardware implementations for testing.
 """
 
 import logging
-import threading
 import time
 from typing import Optional, Callable, Dict
 from boss.core.interfaces.hardware import (
     ButtonInterface, GoButtonInterface, LedInterface, SwitchInterface, 
-    DisplayInterface, ScreenInterface, SpeakerInterface
+    DisplayInterface, ScreenInterface, SpeakerInterface, ScreenSize
 )
 from boss.core.models import LedColor, ButtonColor, LedState, SwitchState
 
 logger = logging.getLogger(__name__)
 
+# Go button reads as pressed for this long after a simulated press
+_GO_AUTO_RELEASE_SECONDS = 0.1
+
 
 class MockButtons(ButtonInterface):
     """Mock button implementation."""
@@ -64,7 +66,7 @@ class MockButtons(ButtonInterface):
             callback = self._press_callbacks.get(color)
             if callback:
                 callback(color)
-            logger.debug(f"Mock button {color.value} pressed")
+            logger.debug("Mock button %s pressed", color.value)
     
     def simulate_release(self, color: ButtonColor) -> None:
         """Simulate button release (for testing)."""
@@ -73,14 +75,15 @@ class MockButtons(ButtonInterface):
             callback = self._release_callbacks.get(color)
             if callback:
                 callback(color)
-            logger.debug(f"Mock button {color.value} released")
+            logger.debug("Mock button %s released", color.value)
 
 
 class MockGoButton(GoButtonInterface):
     """Mock Go button implementation."""
     
     def __init__(self):
-        self._pressed = False
+        # Pressed while monotonic() < this deadline; avoids a release thread per press
+        self._pressed_until = 0.0
         self._press_callback: Optional[Callable] = None
         self._available = False
     
@@ -101,7 +104,7 @@ class MockGoButton(GoButtonInterface):
     
     def is_pressed(self) -> bool:
         """Check if the Go button is currently pressed."""
-        return self._pressed
+        return time.monotonic() < self._pressed_until
     
     def set_press_callback(self, callback: Callable[[], None]) -> None:
         """Set callback for Go button press events."""
@@ -109,17 +112,12 @@ class MockGoButton(GoButtonInterface):
     
     def simulate_press(self) -> None:
         """Simulate Go button press (for testing)."""
-        self._pressed = True
+        # Held for the duration of the callback, then auto-released shortly after
+        self._pressed_until = float("inf")
         if self._press_callback:
             self._press_callback()
         logger.debug("Mock Go button pressed")
-        
-        # Auto-release after short delay
-        def auto_release():
-            time.sleep(0.1)
-            self._pressed = False
-        
-        threading.Thread(target=auto_release, daemon=True).start()
+        self._pressed_until = time.monotonic() + _GO_AUTO_RELEASE_SECONDS
 
 
 class MockLeds(LedInterface):
@@ -164,9 +162,10 @@ class MockLeds(LedInterface):
 class MockSwitches(SwitchInterface):
     """Mock switch implementation."""
     
+    pushes_changes = True  # change callback fires on every simulate_switch_change()
+    
     def __init__(self):
         self._switch_value = 0
-        self._individual_switches = {i: False for i in range(8)}
         self._change_callback: Optional[Callable] = None
         self._available = False
     
@@ -187,10 +186,7 @@ class MockSwitches(SwitchInterface):
     
     def read_switches(self) -> SwitchState:
         """Read current switch state."""
-        return SwitchState(
-            value=self._switch_value,
-            individual_switches=self._individual_switches.copy()
-        )
+        return SwitchState(value=self._switch_value)
     
     def set_change_callback(self, callback: Callable[[int, int], None]) -> None:
         """Set callback for switch change events."""
@@ -204,10 +200,6 @@ class MockSwitches(SwitchInterface):
         old_value = self._switch_value
         self._switch_value = new_value
         
-        # Update individual switches
-        for i in range(8):
-            self._individual_switches[i] = bool(new_value & (1 << i))
-        
         if self._change_callback and old_value != new_value:
             self._change_callback(old_value, new_value)
         
@@ -268,6 +260,7 @@ class MockScreen(ScreenInterface):
     def __init__(self, width: int = 800, height: int = 480):
         self._width = width
         self._height = height
+        self._size = ScreenSize(width, height)
         self._current_content = "BOSS Screen Ready"
         self._available = False
     
@@ -315,9 +308,9 @@ class MockScreen(ScreenInterface):
         self._current_content = f"Cleared ({color})"
         logger.debug(f"Mock screen cleared with color: {color}")
     
-    def get_screen_size(self) -> tuple:
+    def get_screen_size(self) -> ScreenSize:
         """Get screen dimensions (width, height)."""
-        return (self._width, self._height)
+        return self._size
 
 
 class MockSpeaker(SpeakerInterface):
@@ -3,17 +3,22 @@ WebUI hardware implementations for development.
 """
 
 import logging
-import threading
 import time
 from typing import Optional, Callable, Dict
 from boss.core.interfaces.hardware import (
     ButtonInterface, GoButtonInterface, LedInterface, SwitchInterface, 
-    DisplayInterface, ScreenInterface, SpeakerInterface
+    DisplayInterface, ScreenInterface, SpeakerInterface, ScreenSize
 )
 from boss.core.models import LedColor, ButtonColor, LedState, SwitchState
 
 logger = logging.getLogger(__name__)
 
+# Go button reads as pressed for this long after a simulated press
+_GO_AUTO_RELEASE_SECONDS = 0.1
+
+# Colour name -> ButtonColor; a dict hit is cheaper than ButtonColor(value)
+_BUTTON_COLORS = {color.value: color for color in ButtonColor}
+
 
 class WebUIButtons(ButtonInterface):
     """WebUI button implementation - simulates buttons in web interface."""
@@ -59,34 +64,35 @@ class WebUIButtons(ButtonInterface):
     
     def handle_button_press(self, color_str: str) -> None:
         """Handle button press from web interface."""
-        try:
-            color = ButtonColor(color_str)
-            self._button_states[color] = True
-            callback = self._press_callbacks.get(color)
-            if callback:
-                callback(color)
-            logger.debug(f"WebUI button {color.value} pressed")
-        except ValueError:
+        color = _BUTTON_COLORS.get(color_str)
+        if color is None:
             logger.error(f"Invalid button color from WebUI: {color_str}")
+            return
+        self._button_states[color] = True
+        callback = self._press_callbacks.get(color)
+        if callback:
+            callback(color)
+        logger.debug("WebUI button %s pressed", color_str)
     
     def handle_button_release(self, color_str: str) -> None:
         """Handle button release from web interface."""
-        try:
-            color = ButtonColor(color_str)
-            self._button_states[color] = False
-            callback = self._release_callbacks.get(color)
-            if callback:
-                callback(color)
-            logger.debug(f"WebUI button {color.value} released")
-        except ValueError:
+        color = _BUTTON_COLORS.get(color_str)
+        if color is None:
             logger.error(f"Invalid button color from WebUI: {color_str}")
+            return
+        self._button_states[color] = False
+        callback = self._release_callbacks.get(color)
+        if callback:
+            callback(color)
+        logger.debug("WebUI button %s released", color_str)
 
 
 class WebUIGoButton(GoButtonInterface):
     """WebUI Go button implementation."""
     
     def __init__(self):
-        self._pressed = False
+        # Pressed while monotonic() < this deadline; avoids a release thread per press
+        self._pressed_until = 0.0
         self._press_callback: Optional[Callable] = None
         self._available = False
     
@@ -107,7 +113,7 @@ class WebUIGoButton(GoButtonInterface):
     
     def is_pressed(self) -> bool:
         """Check if the Go button is currently pressed."""
-        return self._pressed
+        return time.monotonic() < self._pressed_until
     
     def set_press_callback(self, callback: Callable[[], None]) -> None:
         """Set callback for Go button press events."""
@@ -115,17 +121,12 @@ class WebUIGoButton(GoButtonInterface):
     
     def handle_press(self) -> None:
         """Handle Go button press from web interface."""
-        self._pressed = True
+        # Held for the duration of the callback, then auto-released shortly after
+        self._pressed_until = float("inf")
         if self._press_callback:
             self._press_callback()
         logger.debug("WebUI Go button pressed")
-        
-        # Auto-release after short delay
-        def auto_release():
-            time.sleep(0.1)
-            self._pressed = False
-        
-        threading.Thread(target=auto_release, daemon=True).start()
+        self._pressed_until = time.monotonic() + _GO_AUTO_RELEASE_SECONDS
 
 
 class WebUILeds(LedInterface):
@@ -163,8 +164,8 @@ class WebUILeds(LedInterface):
         logger.debug(f"WebUI LED {color.value}: {'ON' if is_on else 'OFF'} (brightness: {brightness})")
         
         # Publish event for WebUI update
-        if self._event_bus:
-            self._event_bus.publish("output.led.state_changed", {
+        if self._event_bus and self._event_bus.has_subscribers("output.led.state_changed"):
+            self._event_bus.publish_conflating("output.led.state_changed", color.value, {
                 "led_id": color.value,
                 "state": "on" if is_on else "off",
                 "brightness": brightness
@@ -183,9 +184,10 @@ class WebUILeds(LedInterface):
 class WebUISwitches(SwitchInterface):
     """WebUI switch implementation - switches controlled via web interface."""
     
+    pushes_changes = True  # change callback fires on every handle_switch_change()
+    
     def __init__(self):
         self._switch_value = 0
-        self._individual_switches = {i: False for i in range(8)}
         self._change_callback: Optional[Callable] = None
         self._available = False
     
@@ -206,10 +208,7 @@ class WebUISwitches(SwitchInterface):
     
     def read_switches(self) -> SwitchState:
         """Read current switch state."""
-        return SwitchState(
-            value=self._switch_value,
-            individual_switches=self._individual_switches.copy()
-        )
+        return SwitchState(value=self._switch_value)
     
     def set_change_callback(self, callback: Callable[[int, int], None]) -> None:
         """Set callback for switch change events."""
@@ -224,10 +223,6 @@ class WebUISwitches(SwitchInterface):
         old_value = self._switch_value
         self._switch_value = new_value
         
-        # Update individual switches
-        for i in range(8):
-            self._individual_switches[i] = bool(new_value & (1 << i))
-        
         if self._change_callback and old_value != new_value:
             self._change_callback(old_value, new_value)
         
@@ -272,11 +267,12 @@ class WebUIDisplay(DisplayInterface):
         logger.debug(f"WebUI display: {value} (brightness: {brightness})")
         
         # Publish event for WebUI update
-        if self._event_bus:
+        if self._event_bus and self._event_bus.has_subscribers("output.display.updated"):
             # Only emit the output.display.updated event; the canonical display_update
             # is published by the system when switches change. Avoid duplicate/legacy
-            # events that can cause transient UI state.
-            self._event_bus.publish("output.display.updated", {
+            # events that can cause transient UI state. Display events conflate:
+            # if the UI lags, only the newest state is delivered.
+            self._event_bus.publish_conflating("output.display.updated", "display", {
                 "type": "number",
                 "value": value,
                 "brightness": brightness,
@@ -289,8 +285,8 @@ class WebUIDisplay(DisplayInterface):
         logger.debug(f"WebUI display text: '{text}' (brightness: {brightness})")
         
         # Publish event for WebUI update
-        if self._event_bus:
-            self._event_bus.publish("output.display.updated", {
+        if self._event_bus and self._event_bus.has_subscribers("output.display.updated"):
+            self._event_bus.publish_conflating("output.display.updated", "display", {
                 "type": "text",
                 "text": text,
                 "brightness": brightness
@@ -302,8 +298,8 @@ class WebUIDisplay(DisplayInterface):
         logger.debug("WebUI display cleared")
         
         # Publish event for WebUI update
-        if self._event_bus:
-            self._event_bus.publish("output.display.updated", {
+        if self._event_bus and self._event_bus.has_subscribers("output.display.updated"):
+            self._event_bus.publish_conflating("output.display.updated", "display", {
                 "type": "clear",
                 "text": "",
                 "brightness": self._brightness
@@ -315,8 +311,8 @@ class WebUIDisplay(DisplayInterface):
         logger.debug(f"WebUI display brightness: {brightness}")
         
         # Publish event for WebUI update
-        if self._event_bus:
-            self._event_bus.publish("output.display.updated", {
+        if self._event_bus and self._event_bus.has_subscribers("output.display.updated"):
+            self._event_bus.publish_conflating("output.display.updated", "display", {
                 "type": "brightness",
                 "brightness": brightness,
                 "text": str(self._current_value) if self._current_value is not None else ""
@@ -329,6 +325,7 @@ class WebUIScreen(ScreenInterface):
     def __init__(self, width: int = 800, height: int = 480, event_bus=None):
         self._width = width
         self._height = height
+        self._size = ScreenSize(width, height)
         self._current_content = "BOSS WebUI Screen Ready"
         self._available = False
         self._event_bus = event_bus
@@ -423,9 +420,9 @@ class WebUIScreen(ScreenInterface):
         
         logger.info(f"WebUI screen cleared with color: {color}")
     
-    def get_screen_size(self) -> tuple:
+    def get_screen_size(self) -> ScreenSize:
         """Get screen dimensions (width, height)."""
-        return (self._width, self._height)
+        return self._size
 
 
 class WebUISpeaker(SpeakerInterface):
@@ -13,8 +13,20 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
 logger = logging.getLogger("boss.ui.api.web_ui")
 
+
+def _dumps(message: Dict[str, Any]) -> str:
+    """Serialize a WebSocket message (orjson when available, stdlib json otherwise)."""
+    if orjson is not None:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(message)
+
 # Request/Response Models
 class ButtonPressRequest(BaseModel):
     pass
@@ -92,10 +104,12 @@ class WebSocketManager:
         if not self.active_connections:
             return
             
+        # Serialize once for all clients
+        text = _dumps(message)
         disconnected = []
         for connection in self.active_connections:
             try:
-                await connection.send_text(json.dumps(message))
+                await connection.send_text(text)
             except Exception as e:
                 logger.debug(f"Failed to send message to client: {e}")
                 disconnected.append(connection)
@@ -108,7 +122,7 @@ class WebSocketManager:
         """Send the current hardware state to a newly connected client."""
         try:
             state = self._get_current_state()
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(_dumps({
                 "event": "initial_state",
                 "payload": state,
                 "timestamp": time.time()
@@ -82,9 +82,24 @@ class TestEventBus:
         time.sleep(0.1)
         
         handler.assert_called_once_with("test_event", payload)
-        
+
         event_bus.stop()
-    
+
+    def test_publish_many_preserves_order(self):
+        """Test publishing a batch of events."""
+        event_bus = EventBus()
+        event_bus.start()
+
+        received = []
+        event_bus.subscribe("test_event", lambda t, p: received.append(p["n"]))
+
+        event_bus.publish_many([("test_event", {"n": n}, "test") for n in range(5)])
+        time.sleep(0.1)
+
+        assert received == [0, 1, 2, 3, 4]
+
+        event_bus.stop()
+
     def test_event_filtering(self):
         """Test event filtering functionality."""
         event_bus = EventBus()
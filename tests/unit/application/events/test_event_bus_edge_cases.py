@@ -57,3 +57,68 @@ def test_unsubscribe_nonexistent_id_is_noop():
     bus.unsubscribe('not-a-real-id')  # Should not raise
     bus.start()
     bus.stop()
+
+
+def test_publish_without_subscribers_is_not_queued_once_running():
+    bus = EventBus()
+    bus.start()
+    try:
+        bus.publish('nobody_listens', {'a': 1})
+        assert bus.get_stats()['queue_size'] == 0
+    finally:
+        bus.stop()
+
+
+def test_has_subscribers_tracks_subscriptions_once_running():
+    bus = EventBus()
+    # Pre-start publishes are queued, so they always count as deliverable
+    assert bus.has_subscribers('ticks')
+    bus.start()
+    try:
+        assert not bus.has_subscribers('ticks')
+        sub_id = bus.subscribe('ticks', lambda t, p: None)
+        assert bus.has_subscribers('ticks')
+        bus.unsubscribe(sub_id)
+        assert not bus.has_subscribers('ticks')
+    finally:
+        bus.stop()
+
+
+def test_publish_conflating_replaces_pending_event():
+    bus = EventBus()
+    received = []
+    bus.subscribe('led', lambda t, p: received.append(p))
+    # Queued before start, so the first event is still pending when the rest arrive
+    bus.publish_conflating('led', 'red', {'color': 'red', 'on': True})
+    bus.publish_conflating('led', 'blue', {'color': 'blue', 'on': True})
+    bus.publish_conflating('led', 'red', {'color': 'red', 'on': False})
+    assert bus.get_stats()['queue_size'] == 2
+    bus.start()
+    try:
+        time.sleep(0.1)
+        bus.publish_conflating('led', 'red', {'color': 'red', 'on': True})
+        time.sleep(0.1)
+    finally:
+        bus.stop()
+    assert received == [
+        {'color': 'red', 'on': False},
+        {'color': 'blue', 'on': True},
+        {'color': 'red', 'on': True},
+    ]
+
+
+def test_many_filtered_subscribers_only_matching_called():
+    bus = EventBus()
+    calls = []
+    colors = ['red', 'yellow', 'green', 'blue', 'white']
+    for color in colors:
+        bus.subscribe('button_pressed', lambda t, p, c=color: calls.append(c), {'button': color})
+    bus.start()
+    try:
+        bus.publish('button_pressed', {'button': 'green'})
+        # Unhashable payload values must not break prefiltering
+        bus.publish('button_pressed', {'button': 'blue', 'extra': [1, 2]})
+        time.sleep(0.1)
+    finally:
+        bus.stop()
+    assert calls == ['green', 'blue']
@@ -4,6 +4,7 @@ Unit tests for AppManager service.
 
 import pytest
 import json
+import os
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 
@@ -93,6 +94,27 @@ class TestAppManager:
         
         assert mappings == {}
     
+    def test_load_app_mappings_reuses_parse_until_file_changes(self, mock_event_bus, mock_config, tmp_path):
+        """Test that unchanged mappings are served from the mtime cache."""
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        mappings_file = tmp_path / "app_mappings.json"
+        mappings_file.write_text(json.dumps({"0": "list_all_apps"}))
+        
+        hardware_service = Mock()
+        app_manager = AppManager(apps_dir, mock_event_bus, hardware_service, mock_config)
+        app_manager._app_mappings_file = mappings_file
+        
+        first = app_manager._load_app_mappings()
+        assert app_manager._load_app_mappings() is first
+        
+        # Rewrite with a newer mtime; cache must be invalidated
+        mappings_file.write_text(json.dumps({"1": "hello_world"}))
+        stat = mappings_file.stat()
+        os.utime(mappings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert app_manager._load_app_mappings() == {"1": "hello_world"}
+
     def test_load_app_with_standard_manifest(self, mock_event_bus, mock_config, tmp_path):
         """Test loading an app with standard manifest format."""
         apps_dir = tmp_path / "apps"
@@ -121,9 +143,9 @@ class TestAppManager:
         
         hardware_service = Mock()
         app_manager = AppManager(apps_dir, mock_event_bus, hardware_service, mock_config)
-        mappings = {"0": "test_app"}
+        name_to_switch = {"test_app": 0}
         
-        app = app_manager._load_app(app_dir, mappings)
+        app = app_manager._load_app(app_dir, name_to_switch)
         
         assert app is not None
         assert app.switch_value == 0
@@ -155,9 +177,9 @@ class TestAppManager:
         
         hardware_service = Mock()
         app_manager = AppManager(apps_dir, mock_event_bus, hardware_service, mock_config)
-        mappings = {"0": "test_app"}
+        name_to_switch = {"test_app": 0}
         
-        app = app_manager._load_app(app_dir, mappings)
+        app = app_manager._load_app(app_dir, name_to_switch)
         
         assert app is not None
         assert app.switch_value == 0
@@ -188,9 +210,9 @@ class TestAppManager:
         
         hardware_service = Mock()
         app_manager = AppManager(apps_dir, mock_event_bus, hardware_service, mock_config)
-        mappings = {"0": "other_app"}  # Different app mapped
+        name_to_switch = {"other_app": 0}  # Different app mapped
         
-        app = app_manager._load_app(app_dir, mappings)
+        app = app_manager._load_app(app_dir, name_to_switch)
         
         assert app is None  # Should return None for unmapped apps
     
@@ -228,7 +250,8 @@ class TestAppManager:
         
         # Create mock app
         mock_app = Mock(spec=App)
-        app_manager._apps[42] = mock_app
+        mock_app.switch_value = 42
+        app_manager._register_app(mock_app)
         
         result = app_manager.get_app_by_switch_value(42)
         assert result == mock_app
@@ -254,6 +277,27 @@ class TestAppManager:
         assert result == {1: mock_app1, 2: mock_app2}
         assert result is not app_manager._apps  # Should be a copy
     
+    def test_get_app_summaries_returns_fresh_dicts(self, mock_event_bus, mock_config, tmp_path):
+        """Test that summaries are plain dicts by default and the view is shared."""
+        apps_dir = tmp_path / "apps"
+        apps_dir.mkdir()
+        
+        hardware_service = Mock()
+        app_manager = AppManager(apps_dir, mock_event_bus, hardware_service, mock_config)
+        mock_app = Mock(spec=App)
+        mock_app.manifest = AppManifest(name="One", description="d", version="1", author="a")
+        app_manager._apps = {7: mock_app}
+        
+        summaries = app_manager.get_app_summaries()
+        assert summaries == [{"number": "007", "name": "One", "description": "d"}]
+        assert type(summaries[0]) is dict
+        summaries[0]["name"] = "Changed"
+        assert app_manager.get_app_summaries()[0]["name"] == "One"
+        
+        view = app_manager.get_app_summaries_view()
+        assert view is app_manager.get_app_summaries_view()
+        assert view[0]["name"] == "One"
+    
     def test_current_app_management(self, mock_event_bus, mock_config, tmp_path):
         """Test current app get/set functionality."""
         apps_dir = tmp_path / "apps"
@@ -146,6 +146,39 @@ class TestSystemManager:
         assert system_manager._running == False
         assert system_manager._shutdown_event.is_set()
     
+    def test_stop_discards_queued_launches(self):
+        """Test that launches queued behind a running job never start after stop()."""
+        event_bus = Mock()
+        hardware_service = Mock()
+        app_manager = Mock()
+        app_runner = Mock()
+        
+        system_manager = SystemManager(
+            event_bus=event_bus,
+            hardware_service=hardware_service,
+            app_manager=app_manager,
+            app_runner=app_runner
+        )
+        system_manager._running = True
+        system_manager._start_launcher()
+        
+        # Occupy the launcher so the launch request waits in its queue
+        started = threading.Event()
+        release = threading.Event()
+        system_manager._run_off_bus(lambda: (started.set(), release.wait(2.0)))
+        assert started.wait(1.0)
+        
+        with patch.object(system_manager, '_launch_app_for_current_switch') as mock_launch, \
+             patch.object(system_manager, 'stop_webui_if_running'):
+            system_manager._on_app_launch_requested("app_launch_requested", {})
+            threading.Timer(0.1, release.set).start()
+            system_manager.stop()
+            # Requests arriving after stop() are dropped rather than run inline
+            system_manager._on_app_launch_requested("app_launch_requested", {})
+        
+        mock_launch.assert_not_called()
+        app_runner.stop_current_app.assert_called_once()
+    
     def test_stop_system_not_running(self):
         """Test stopping system when not running."""
         event_bus = Mock()
@@ -0,0 +1,51 @@
+"""
+Unit tests for the AppManifest model.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+from boss.core.models import AppManifest
+
+
+class TestAppManifest:
+    """Test cases for AppManifest loading and serialization."""
+
+    def test_manifest_from_file_cached_until_file_changes(self, tmp_path):
+        """Test that AppManifest.from_file reuses parses of unchanged files."""
+        manifest_file = tmp_path / "manifest.json"
+        manifest_file.write_text(json.dumps({"name": "One", "description": "d"}))
+
+        with patch.object(AppManifest, "_parse_file", wraps=AppManifest._parse_file) as parse:
+            first = AppManifest.from_file(manifest_file)
+            assert AppManifest.from_file(manifest_file) == first
+            assert parse.call_count == 1
+
+        manifest_file.write_text(json.dumps({"name": "Two", "description": "d"}))
+        stat = manifest_file.stat()
+        os.utime(manifest_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert AppManifest.from_file(manifest_file).name == "Two"
+
+    def test_manifest_from_file_cache_hits_are_independent(self, tmp_path):
+        """Test that mutating one cached load does not leak into the next."""
+        manifest_file = tmp_path / "manifest.json"
+        manifest_file.write_text(json.dumps({"name": "One", "description": "d", "tags": ["a"]}))
+
+        first = AppManifest.from_file(manifest_file)
+        first.name = "Changed"
+        first.tags.append("b")
+
+        second = AppManifest.from_file(manifest_file)
+        assert second is not first
+        assert second.name == "One"
+        assert second.tags == ["a"]
+
+    def test_manifest_to_dict_reflects_later_changes(self):
+        """Test that to_dict reports fields assigned after a previous call."""
+        manifest = AppManifest(name="One", description="d", version="1", author="a")
+        assert manifest.to_dict()["name"] == "One"
+
+        manifest.name = "Two"
+        assert manifest.to_dict()["name"] == "Two"
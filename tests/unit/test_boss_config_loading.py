@@ -0,0 +1,26 @@
+"""
+Tests for BossConfig file loading.
+"""
+
+import shutil
+from pathlib import Path
+
+from boss.core.models import BossConfig
+
+SAMPLE_CONFIG = Path(__file__).resolve().parents[2] / "boss" / "config" / "boss_config.json"
+
+
+def test_from_file_loads_do_not_share_nested_values(tmp_path):
+    config_file = tmp_path / "boss_config.json"
+    shutil.copy(SAMPLE_CONFIG, config_file)
+
+    first = BossConfig.from_file(config_file)
+    original_pin = first.hardware.button_pins["red"]
+    first.hardware.button_pins["red"] = 999
+    first.hardware.switch_select_pins.append(99)
+
+    second = BossConfig.from_file(config_file)
+    assert second.hardware.button_pins is not first.hardware.button_pins
+    assert second.hardware.button_pins["red"] == original_pin
+    assert 99 not in second.hardware.switch_select_pins
+
@@ -91,3 +91,40 @@ def test_tm1637_display_initialize_and_basic_ops(monkeypatch):
     ops = [op for op, _ in tm.commands]
     assert "number" in ops or "show" in ops
     assert "clear" in ops
+
+
+def test_tm1637_display_skips_unchanged_writes(monkeypatch):
+    mod = sys.modules[GPIODisplay.__module__]
+    monkeypatch.setattr(mod, "HAS_GPIO", True, raising=False)
+
+    disp = GPIODisplay(make_hw_config())
+    assert disp.initialize() is True
+    tm = disp._tm
+
+    disp.show_number(7)
+    disp.show_number(7)
+    disp.show_number(8)
+    disp.show_text("LOAD")
+    disp.show_text("LOAD")
+    disp.show_number(8)
+
+    writes = [cmd for cmd in tm.commands if cmd[0] != "clear"]
+    assert writes == [("number", 7), ("number", 8), ("write", tuple(ord(c) for c in "LOAD")), ("number", 8)]
+
+
+def test_tm1637_display_sends_brightness_only_on_change(monkeypatch):
+    mod = sys.modules[GPIODisplay.__module__]
+    monkeypatch.setattr(mod, "HAS_GPIO", True, raising=False)
+
+    disp = GPIODisplay(make_hw_config())
+    assert disp.initialize() is True
+    tm = disp._tm
+    levels = []
+    monkeypatch.setattr(tm, "brightness", levels.append)
+
+    disp.show_number(1)
+    disp.show_number(2)
+    disp.show_number(3, brightness=0.5)
+    disp.set_brightness(0.5)
+
+    assert levels == [4]